@@ -0,0 +1,265 @@
+import asyncio
+import itertools
+import random
+import discord
+
+_snowflakes = itertools.count(1_200_000_000_000_000_000)
+
+def snowflake():
+    return next(_snowflakes)
+
+
+class _Response:
+    """Just enough of an aiohttp response for discord.HTTPException."""
+
+    def __init__(self, status, reason):
+        self.status = status
+        self.reason = reason
+
+
+def not_found():
+    return discord.NotFound(_Response(404, "Not Found"), "Unknown Message")
+
+
+class FakeREST:
+    """Stand-in for Discord's REST API: counts calls and injects latency and 429s.
+
+    A 429 is handled the way discord.py's HTTP client does it: wait `retry_after`
+    and retry the same request, so callers only see the extra latency.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.02, rate_limit_ratio=0.0, retry_after=0.5, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.calls = {}  # ✅ route -> requests sent (retries included)
+        self.rate_limited = {}  # ✅ route -> 429s received
+
+    async def call(self, route, action=None):
+        while True:
+            self.calls[route] = self.calls.get(route, 0) + 1
+            await asyncio.sleep(max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter)))
+            if self.random.random() >= self.rate_limit_ratio:
+                return action() if action else None
+            self.rate_limited[route] = self.rate_limited.get(route, 0) + 1
+            await asyncio.sleep(self.retry_after)
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+
+class FakeEmoji:
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+class FakeUser:
+    def __init__(self, user_id, display_name, bot=False):
+        self.id = user_id
+        self.display_name = display_name
+        self.name = display_name
+        self.bot = bot
+        self.mention = f"<@{user_id}>"
+
+
+class FakeMessage(discord.Message):
+    """discord.Message subclass so isinstance checks (e.g. the message cache) behave as in production."""
+
+    def __init__(self, api, channel, author, content="", attachments=()):
+        self.api = api
+        self.id = snowflake()
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content
+        self.attachments = list(attachments)
+        self.reactions = []
+        self.deleted = False
+
+    def __repr__(self):
+        return f"<FakeMessage id={self.id} channel={self.channel.name}>"
+
+    async def add_reaction(self, emoji):
+        await self.api.call("add_reaction", lambda: self._alive())
+
+    async def remove_reaction(self, emoji, member):
+        await self.api.call("remove_reaction", lambda: self._alive())
+
+    async def edit(self, content=None, **kwargs):
+        def apply():
+            self._alive()
+            if content is not None:
+                self.content = content
+            return self
+        return await self.api.call("edit_message", apply)
+
+    async def delete(self):
+        def apply():
+            self._alive()
+            self.deleted = True
+            self.channel._messages.pop(self.id, None)
+        await self.api.call("delete_message", apply)
+
+    async def pin(self):
+        await self.api.call("pin", lambda: self._alive())
+
+    def _alive(self):
+        if self.deleted:
+            raise not_found()
+
+
+class FakeTextChannel:
+    def __init__(self, api, guild, name, category=None, topic=None):
+        self.api = api
+        self.id = snowflake()
+        self.guild = guild
+        self.name = name
+        self.category = category
+        self.topic = topic
+        self.mention = f"<#{self.id}>"
+        self._messages = {}
+
+    def post(self, author, content=""):
+        """Creates a message without a REST call (used for users' command messages)."""
+        message = FakeMessage(self.api, self, author, content)
+        self._messages[message.id] = message
+        return message
+
+    async def send(self, content=None, file=None, **kwargs):
+        return await self.api.call("send_message", lambda: self.post(self.guild.bot_user, content or ""))
+
+    async def fetch_message(self, message_id):
+        def lookup():
+            message = self._messages.get(message_id)
+            if message is None:
+                raise not_found()
+            return message
+        return await self.api.call("fetch_message", lookup)
+
+    async def delete_messages(self, messages):
+        def apply():
+            for message in messages:
+                found = self._messages.pop(message.id, None)
+                if found:
+                    found.deleted = True
+        await self.api.call("bulk_delete", apply)
+
+
+class FakeCategory:
+    def __init__(self, guild, name):
+        self.id = snowflake()
+        self.guild = guild
+        self.name = name
+        self.text_channels = []
+
+
+class FakeGuild:
+    def __init__(self, api, bot_user):
+        self.api = api
+        self.id = snowflake()
+        self.bot_user = bot_user
+        self.channels = []
+        self.categories = []
+        self.members = []
+        self._by_id = {}
+        self._members = {}
+
+    def add_member(self, member):
+        self.members.append(member)
+        self._members[member.id] = member
+
+    def add_category(self, name):
+        category = FakeCategory(self, name)
+        self.categories.append(category)
+        self._by_id[category.id] = category
+        return category
+
+    def add_text_channel(self, name, category=None, topic=None):
+        channel = FakeTextChannel(self.api, self, name, category, topic)
+        self.channels.append(channel)
+        self._by_id[channel.id] = channel
+        if category:
+            category.text_channels.append(channel)
+        return channel
+
+    def get_channel(self, channel_id):
+        return self._by_id.get(channel_id)
+
+    def get_member(self, user_id):
+        return self._members.get(user_id)
+
+    async def create_text_channel(self, name, category=None, topic=None, **kwargs):
+        return await self.api.call("create_channel", lambda: self.add_text_channel(name, category, topic))
+
+
+class FakeBot:
+    """The slice of commands.Bot the handlers use, plus the attributes bot.py sets in on_ready."""
+
+    def __init__(self, api):
+        self.user = FakeUser(snowflake(), "Countdown", bot=True)
+        self.guild = FakeGuild(api, self.user)
+        self.guilds = [self.guild]
+        self.commands = []
+        self.messages_to_delete = {}
+
+    def get_guild(self, guild_id):
+        return self.guild if guild_id == self.guild.id else None
+
+    def get_channel(self, channel_id):
+        return self.guild.get_channel(channel_id)
+
+
+class FakeContext:
+    """commands.Context for a command typed by `author` in `channel`."""
+
+    def __init__(self, bot, channel, author, content=""):
+        self.bot = bot
+        self.guild = channel.guild
+        self.channel = channel
+        self.author = author
+        self.message = channel.post(author, content)
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+
+class FakeInteractionResponse:
+    """interaction.response: every acknowledgement is one REST call."""
+
+    def __init__(self, api):
+        self.api = api
+
+    async def defer(self, **kwargs):
+        await self.api.call("interaction_response")
+
+    async def send_message(self, content=None, **kwargs):
+        await self.api.call("interaction_response")
+
+
+class FakeInteraction:
+    """discord.Interaction for a button click by `user` on `message`."""
+
+    def __init__(self, message, user):
+        self.message = message
+        self.user = user
+        self.guild = message.guild
+        self.channel = message.channel
+        self.response = FakeInteractionResponse(message.api)
+
+
+class FakePayload:
+    """discord.RawReactionActionEvent for a reaction by `user_id` on a message."""
+
+    def __init__(self, guild_id, channel_id, message_id, user_id, emoji, event_type="REACTION_ADD"):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.user_id = user_id
+        self.emoji = FakeEmoji(emoji)
+        self.event_type = event_type
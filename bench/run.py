@@ -0,0 +1,263 @@
+"""Offline load test: replays synthetic workloads through the real handlers against a fake Discord.
+
+    python -m bench.run --users 50 --events 200 --ops 2000 --concurrency 25 \
+        --latency 0.05 --rate-limit 0.02 --mix reset=5,share=3,claim=1,ping=2,delete=1,list=1 \
+        --ui buttons
+
+Reports throughput, p50/p99 latency and Discord API calls per operation. Nothing
+talks to Discord: every REST call lands on bench.fake_discord.FakeREST, and the
+SQLite store and attachment cache live in a temporary directory.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+_workdir = tempfile.mkdtemp(prefix="countdown-bench-")
+os.environ["COUNTDOWN_DB"] = os.path.join(_workdir, "bench.db")  # ✅ Must be set before config is imported
+os.environ["ATTACHMENT_CACHE_DIR"] = os.path.join(_workdir, "attachments")
+os.environ["SPAWN_HISTORY_FILE"] = os.path.join(_workdir, "spawn_history.bin")
+os.environ["METRICS_PORT"] = "0"
+if "--ui" in sys.argv[1:-1]:
+    os.environ["UI_MODE"] = sys.argv[sys.argv.index("--ui") + 1]  # ✅ Read by config at import time
+
+import config
+from bench.fake_discord import FakeREST, FakeBot, FakeContext, FakeInteraction, FakePayload, FakeUser, snowflake
+from commands.countdown import cd
+from commands.items import list_items
+from events.reactions import handle_reaction, handle_interaction, reaction_action
+from events.ping_manager import ping_scheduler, ping_batcher, schedule_pings
+from events.intel_channels import PERSONAL_CATEGORY, warm_intel_index
+from utils import metrics, rest
+from utils.catalog import item_catalog
+from utils.seeding import reaction_seeder
+
+DEFAULT_MIX = "reset=5,share=3,claim=1,ping=2,delete=1,list=1"
+REACTION_EMOJIS = {"reset": "✅", "claim": "📥", "ping": "🔔", "delete": "🗑️"}
+
+
+class Recorder:
+    """Exact per-operation latency samples (the metrics histograms only keep buckets)."""
+
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+        self.error_types = {}  # ✅ "operation: ExceptionType" -> count
+
+    async def run(self, operation, histogram, factory, **labels):
+        started = time.perf_counter()
+        try:
+            with metrics.timed(histogram, operation, **labels):
+                await factory()
+        except Exception as e:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+            label = f"{operation}: {type(e).__name__}"
+            self.error_types[label] = self.error_types.get(label, 0) + 1
+        self.samples.setdefault(operation, []).append(time.perf_counter() - started)
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - set(REACTION_EMOJIS) - {"share", "list"}
+    if unknown:
+        raise SystemExit(f"Unknown operations in --mix: {', '.join(sorted(unknown))}")
+    return mix
+
+
+def build_world(api, users):
+    bot = FakeBot(api)
+    guild = bot.guild
+    home = guild.add_text_channel("spawns")
+    for name in config.GATHERING_CHANNELS.values():
+        guild.add_text_channel(name)
+    guild.add_category(PERSONAL_CATEGORY)
+    for index in range(users):
+        guild.add_member(FakeUser(snowflake(), f"User {index}"))
+    return bot, home
+
+
+async def gather_limited(concurrency, factories):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(factory):
+        async with semaphore:
+            await factory()
+
+    await asyncio.gather(*(limited(factory) for factory in factories))
+
+
+async def wait_idle(timeout=120):
+    """Waits for background seeding and queued REST calls to finish."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not reaction_seeder._workers and not reaction_seeder._requests and rest.dispatcher.queue_depth == 0 and not rest._background:
+            return
+        await asyncio.sleep(0.05)
+
+
+async def run_workload(args):
+    api = FakeREST(args.latency, args.jitter, args.rate_limit, args.retry_after, seed=args.seed)
+    rng = random.Random(args.seed)
+    bot, home = build_world(api, args.users)
+    guild, members = bot.guild, bot.guild.members
+    reaction_seeder.interval = args.reaction_interval
+    items = list(item_catalog.items()) or ["willow"]
+    recorder = Recorder()
+
+    await warm_intel_index(bot)
+    ping_task = asyncio.create_task(schedule_pings(bot))
+    started = time.perf_counter()
+
+    # ✅ Phase 1: M events posted with !cd (half of them with a stored duration, half explicit)
+    def cd_op(index):
+        args_ = [items[index % len(items)]] if index % 2 else [items[index % len(items)], f"{rng.randint(1, 8)}h", "r2"]
+        ctx = FakeContext(bot, home, rng.choice(members), "!cd " + " ".join(args_))
+        return lambda: recorder.run("cd", metrics.COMMAND_LATENCY, lambda: cd(bot, ctx, *args_), command="cd")
+
+    await gather_limited(args.concurrency, [cd_op(index) for index in range(args.events)])
+
+    # ✅ Phase 2: reaction storm over whatever events exist when each op is picked
+    mix = parse_mix(args.mix)
+    names, weights = list(mix), list(mix.values())
+    shares = list(config.GATHERING_CHANNELS)
+
+    def reaction_op(kind):
+        async def op():
+            if kind == "list":
+                ctx = FakeContext(bot, home, rng.choice(members), "!list")
+                await recorder.run("list", metrics.COMMAND_LATENCY, lambda: list_items(ctx), command="list")
+                return
+            if not bot.messages_to_delete:
+                return
+            record = bot.messages_to_delete[rng.choice(list(bot.messages_to_delete))]
+            emoji = rng.choice(shares) if kind == "share" else REACTION_EMOJIS[kind]
+            await recorder.run(kind, metrics.REACTION_LATENCY, click(record, rng.choice(members), emoji),
+                               action=reaction_action(emoji))
+        return op
+
+    def click(record, member, emoji):
+        """A reaction, or with --ui buttons a button click on the same message."""
+        if config.UI_MODE == "buttons":
+            message = bot.get_channel(record.channel_id)._messages.get(record.message_id)
+            if message is None:
+                return lambda: asyncio.sleep(0)  # ✅ Message already gone, nothing to click
+            return lambda: handle_interaction(bot, FakeInteraction(message, member), emoji)
+        payload = FakePayload(guild.id, record.channel_id, record.message_id, member.id, emoji)
+        return lambda: handle_reaction(bot, payload)
+
+    await gather_limited(args.concurrency, [reaction_op(kind) for kind in rng.choices(names, weights, k=args.ops)])
+    storm_elapsed = time.perf_counter() - started
+    await wait_idle()
+
+    # ✅ Phase 3: reminder delivery for events that are about to spawn
+    before = set(bot.messages_to_delete)
+    for _ in range(args.ping_events):
+        ctx = FakeContext(bot, home, rng.choice(members), "!cd")
+        await cd(bot, ctx, items[0], f"{15 * 60 + 1}s")  # ✅ Ping is due one second from now
+    for message_id in set(bot.messages_to_delete) - before:
+        for member in rng.sample(members, min(len(members), args.subscribers)):
+            await recorder.run("ping", metrics.REACTION_LATENCY, click(bot.messages_to_delete[message_id], member, "🔔"),
+                               action="ping")
+    deadline = time.monotonic() + 10 + config.PING_BATCH_WINDOW
+    while (len(ping_scheduler) or len(ping_batcher)) and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+    await wait_idle()
+
+    ping_task.cancel()
+    total_elapsed = time.perf_counter() - started
+    return report(args, api, recorder, storm_elapsed, total_elapsed)
+
+
+def report(args, api, recorder, storm_elapsed, total_elapsed):
+    calls_by_operation = {}
+    for key, value in metrics.REST_CALLS.values.items():
+        operation = dict(key)["operation"]
+        calls_by_operation[operation] = calls_by_operation.get(operation, 0) + value
+
+    operations = {}
+    for operation, samples in sorted(recorder.samples.items()):
+        operations[operation] = {
+            "count": len(samples),
+            "errors": recorder.errors.get(operation, 0),
+            "p50_ms": percentile(samples, 0.5) * 1000,
+            "p99_ms": percentile(samples, 0.99) * 1000,
+            "api_calls_per_op": calls_by_operation.get(operation, 0) / len(samples),
+        }
+
+    seeded = reaction_seeder.stats["messages"]
+    return {
+        "config": vars(args),
+        "storm_seconds": storm_elapsed,
+        "total_seconds": total_elapsed,
+        "throughput_ops_per_s": sum(op["count"] for op in operations.values()) / storm_elapsed if storm_elapsed else 0.0,
+        "operations": operations,
+        "error_types": recorder.error_types,
+        "api_calls": dict(sorted(api.calls.items())),
+        "rate_limited": dict(sorted(api.rate_limited.items())),
+        "dispatcher": dict(rest.dispatcher.stats),
+        "seeding_avg_ms": reaction_seeder.stats["total_latency"] / seeded * 1000 if seeded else 0.0,
+        "scheduler_lag_p99_ms": (metrics.SCHEDULER_LAG.quantile(0.99) or 0.0) * 1000,
+        "reminders_sent": ping_batcher.stats["reminders"],
+        "reminder_messages": ping_batcher.stats["messages"],
+    }
+
+
+def print_report(result):
+    print(f"⏱️  Storm: {result['storm_seconds']:.2f}s · total {result['total_seconds']:.2f}s · "
+          f"{result['throughput_ops_per_s']:.1f} ops/s")
+    print(f"{'operation':<10} {'count':>6} {'errors':>6} {'p50 ms':>9} {'p99 ms':>9} {'api/op':>7}")
+    for name, op in result["operations"].items():
+        print(f"{name:<10} {op['count']:>6} {op['errors']:>6} {op['p50_ms']:>9.1f} {op['p99_ms']:>9.1f} "
+              f"{op['api_calls_per_op']:>7.2f}")
+    if result["error_types"]:
+        print("❌ Errors: " + ", ".join(f"{label} × {count}" for label, count in result["error_types"].items()))
+    print("📮 API calls: " + ", ".join(f"{route} {count}" for route, count in result["api_calls"].items()))
+    if result["rate_limited"]:
+        print("🚦 429s: " + ", ".join(f"{route} {count}" for route, count in result["rate_limited"].items()))
+    print(f"🔀 Dispatcher: {result['dispatcher']}")
+    print(f"🌱 Seeding avg {result['seeding_avg_ms']:.0f}ms · ⏰ scheduler lag p99 {result['scheduler_lag_p99_ms']:.0f}ms · "
+          f"🔔 {result['reminders_sent']} reminders sent in {result['reminder_messages']} messages")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--ops", type=int, default=1000, help="reactions/commands in the storm phase")
+    parser.add_argument("--concurrency", type=int, default=25, help="operations in flight at once")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="weights for reset/share/claim/ping/delete/list")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake REST round trip (s)")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="fraction of requests answered with a 429")
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--reaction-interval", type=float, default=0.0,
+                        help="seeder pacing per channel (production uses utils.seeding.REACTION_INTERVAL)")
+    parser.add_argument("--ping-events", type=int, default=10)
+    parser.add_argument("--subscribers", type=int, default=5, help="🔔 subscribers per ping event")
+    parser.add_argument("--ui", choices=["reactions", "buttons"], default=config.UI_MODE,
+                        help="event controls (sets UI_MODE)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the report to this file (for comparing runs)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_workload(args))
+    print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
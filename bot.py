@@ -3,22 +3,31 @@ from discord.ext import commands
 import config
 from commands.countdown import cd
 from commands.items import add_item, remove_item, list_items  # ✅ Import all item commands
-from events.reactions import handle_reaction
+from commands.bosses import boss
+from commands.board import board
+from events.reactions import handle_reaction, handle_interaction, reaction_action
+from events.controls import EventControls
 from events.ping_manager import schedule_pings  # ✅ Fixed Import
 from events.ping_manager import track_ping_reaction, remove_ping_reaction, delete_pings_for_event
+from events.tracking import restore_events, post_board_events
+from events.sweeper import run_sweeper
+from events import intel_channels
+from utils.transient import transient_messages
+from utils import metrics
+from commands.stats import stats, register_gauges
+from commands.intervals import intervals
+from commands.upcoming import next_spawns
+from commands.remind import remind
 
 import asyncio
 import logging
+import time
+from utils import rest
+from utils.http import close_session
+from utils.logging_setup import setup_logging
 
-# ✅ Reset logging completely
-logging.basicConfig(
-    level=logging.INFO,  # 🔥 Lowered from DEBUG to INFO
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("bot_debug.log"),
-        logging.StreamHandler()
-    ]
-)
+# ✅ Queue-based logging: disk/console writes happen off the event loop
+setup_logging()
 
 logging.info("🚀 Bot is starting...")
 
@@ -30,8 +39,18 @@ intents.messages = True
 intents.guilds = True  
 intents.members = True
 
-# ✅ Initialize bot
-bot = commands.Bot(command_prefix="!", intents=intents)
+# ✅ Initialize bot (sharded when SHARD_COUNT is set, see launcher.py)
+class CountdownBot(commands.AutoShardedBot if config.SHARD_COUNT else commands.Bot):
+    async def close(self):
+        """Closes the shared download session before discord.py shuts down."""
+        await close_session()
+        await super().close()
+
+if config.SHARD_COUNT:
+    bot = CountdownBot(command_prefix="!", intents=intents, shard_count=config.SHARD_COUNT, shard_ids=config.SHARD_IDS)
+    logging.info(f"🧩 Running shards {config.SHARD_IDS or 'all'} of {config.SHARD_COUNT}")
+else:
+    bot = CountdownBot(command_prefix="!", intents=intents)
 
 @bot.event
 async def on_ready():
@@ -39,73 +58,76 @@ async def on_ready():
     
     if not hasattr(bot, "messages_to_delete"):
         bot.messages_to_delete = {}  # ✅ Ensure message tracking works
-    if not hasattr(bot, "list_messages_to_delete"):
-        bot.list_messages_to_delete = []  # ✅ Ensure list message tracking works
-    if not hasattr(bot, "error_messages"):
-        bot.error_messages = {}  # ✅ Ensure error message tracking works
-
-    print(f"✅ Logged in as {bot.user}")
-    print("✅ Bot is running and ready for reactions!")
+        await restore_events(bot)  # ✅ Reload events & pings persisted before the restart
+        await intel_channels.warm_intel_index(bot)  # ✅ user -> personal intel channel lookups
+        register_gauges(bot)
+        bot.add_view(EventControls())  # ✅ Routes button clicks on every event message, including ones posted before a restart
+        bot.metrics_server = await metrics.start_metrics_server()
+
+    logging.info(f"✅ Logged in as {bot.user}")
+    logging.info("✅ Bot is running and ready for reactions!")
     
     # ✅ Debugging: List loaded commands
-    print("✅ Loaded commands:", [cmd.name for cmd in bot.commands])
+    logging.debug("✅ Loaded commands: %s", [cmd.name for cmd in bot.commands])
+
+    # ✅ Start the ping scheduler (only once, on_ready fires again after reconnects)
+    if not hasattr(bot, "ping_task") or bot.ping_task.done():
+        bot.ping_task = bot.loop.create_task(schedule_pings(bot))
+
+    # ✅ Expired errors, !list pages and confirmations are bulk-deleted per channel
+    if not hasattr(bot, "transient_task") or bot.transient_task.done():
+        bot.transient_task = bot.loop.create_task(transient_messages.run())
+
+    # ✅ Evict events that spawned long ago (same once-only guard)
+    if config.SWEEP_INTERVAL and (not hasattr(bot, "sweep_task") or bot.sweep_task.done()):
+        bot.sweep_task = bot.loop.create_task(run_sweeper(bot))
 
-    # ✅ Start the ping scheduler
-    bot.loop.create_task(schedule_pings(bot))
+@bot.before_invoke
+async def start_command_timer(ctx):
+    """Starts the latency timer and tags REST calls with the command name."""
+    ctx.metrics_token = metrics.current_operation.set(ctx.command.name)
+    ctx.metrics_started = time.perf_counter()
+
+@bot.after_invoke
+async def stop_command_timer(ctx):
+    metrics.COMMAND_LATENCY.observe(time.perf_counter() - ctx.metrics_started, command=ctx.command.name)
+    metrics.current_operation.reset(ctx.metrics_token)
 
 @bot.event
 async def on_raw_reaction_add(payload):
-    """Handles reaction events, including bulk deletion for !list messages."""
-    print(f"🔎 DEBUG: Reaction detected: {payload.emoji.name} by User ID {payload.user_id}")
-
-    if payload.emoji.name == "🗑️":
-        guild = bot.get_guild(payload.guild_id)
-        channel = bot.get_channel(payload.channel_id)
-
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except discord.NotFound:
-            return  # ✅ Message was already deleted
-
-        # ✅ Check if this is an error message needing deletion
-        if message.id in bot.error_messages:
-            user_message = bot.error_messages.pop(message.id, None)
-            if user_message:
-                try:
-                    await user_message.delete()
-                except discord.NotFound:
-                    pass  # ✅ User's command message already deleted
-            
-            try:
-                await message.delete()  # ✅ Delete the error message itself
-            except discord.NotFound:
-                pass
-            return
-        
-        # ✅ Ensure `list_messages_to_delete` exists
-        if not hasattr(bot, "list_messages_to_delete"):
-            bot.list_messages_to_delete = []
-
-        # ✅ Check if the message is from the bot and is part of the !list output
-        if bot.list_messages_to_delete and message.id in [msg.id for msg in bot.list_messages_to_delete]:
-            for msg in bot.list_messages_to_delete:
-                try:
-                    await msg.delete()
-                except discord.NotFound:
-                    continue  # ✅ Skip if already deleted
-                except discord.Forbidden:
-                    print("🚫 Bot does not have permission to delete messages!")
-                    return
-            bot.list_messages_to_delete = []  # ✅ Clear the list after deletion
-            return
+    """Handles reaction events, timing each one for the metrics."""
+    action = reaction_action(payload.emoji.name)
+    with metrics.timed(metrics.REACTION_LATENCY, action, action=action):
+        await process_reaction_add(payload)
+
+async def process_reaction_add(payload):
+    """Handles reaction events, including 🗑️ cleanup of errors, !list pages and confirmations."""
+    logging.debug("🔎 Reaction detected: %s by User ID %s", payload.emoji.name, payload.user_id)
+
+    # ✅ 🗑️ on any message of a transient group removes the whole group (O(1) lookup, one bulk delete)
+    if payload.emoji.name == "🗑️" and payload.user_id != bot.user.id and payload.message_id in transient_messages:
+        await transient_messages.delete_group_of(payload.message_id)
+        return
 
     # ✅ Handle other reactions normally
     await handle_reaction(bot, payload)
 
+@bot.event
+async def on_event_control(interaction, emoji):
+    """Handles event button clicks (UI_MODE=buttons), timed like the matching reaction."""
+    action = reaction_action(emoji)
+    with metrics.timed(metrics.REACTION_LATENCY, action, action=action):
+        await handle_interaction(bot, interaction, emoji)
+
+@bot.event
+async def on_board_disabled(channel):
+    """Board events have no message of their own, so leaving board mode posts them."""
+    await post_board_events(bot, channel)
+
 @bot.event
 async def on_raw_reaction_remove(payload):
     """Handles reaction removals, including removing users from pings."""
-    print(f"🔎 DEBUG: Reaction removed: {payload.emoji.name} by User ID {payload.user_id}")
+    logging.debug("🔎 Reaction removed: %s by User ID %s", payload.emoji.name, payload.user_id)
 
     if payload.emoji.name == "🔔":
         guild = bot.get_guild(payload.guild_id)
@@ -118,29 +140,70 @@ async def on_raw_reaction_remove(payload):
         logging.info(f"❌ {user.display_name} removed from pings for event {payload.message_id}")
 
 
+@bot.event
+async def on_guild_channel_create(channel):
+    """Keeps the personal intel channel index current."""
+    await intel_channels.on_channel_create(channel)
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    await intel_channels.on_channel_delete(channel)
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    await intel_channels.on_channel_update(before, after)
+
 @bot.command(name="cd")
 async def command_cd(ctx, *args):
     """Handles event creation with `!cd` command."""
     if not args:
-        error_message = await ctx.send("❌ **Invalid Usage!** Please use `!cd <item_name> <time>`.")
-        await error_message.add_reaction("🗑️")  # ✅ Add trash bin reaction
-        bot.error_messages[error_message.id] = ctx.message  # ✅ Store error to delete later
+        await transient_messages.reply(ctx, "❌ **Invalid Usage!** Please use `!cd <item_name> <time>`.")
         return
 
     await cd(bot, ctx, *args)  # ✅ Now correctly passing both bot and ctx
-    try:
-        await ctx.message.delete()  # ✅ Deletes the command message
-    except discord.NotFound:
-        print("⚠️ Warning: Command message was already deleted.")
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
+
+@bot.command(name="boss")
+async def command_boss(ctx, *args):
+    """Handles boss respawn timers via `!boss <zone> [boss ...]` or `!boss <boss>`"""
+    await boss(bot, ctx, *args)
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
+
+@bot.command(name="board")
+async def command_board(ctx, *args):
+    """Handles board mode via `!board on|off|reset <n>|del <n>`"""
+    await board(bot, ctx, *args)
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
+
+@bot.command(name="stats")
+async def command_stats(ctx):
+    """Shows load and latency stats via `!stats`"""
+    await stats(bot, ctx)
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
+
+@bot.command(name="intervals")
+async def command_intervals(ctx, *args):
+    """Shows observed respawn intervals via `!intervals [item|apply]`"""
+    await intervals(bot, ctx, *args)
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
+
+@bot.command(name="next")
+async def command_next(ctx, *args):
+    """Shows the next spawns via `!next [item|#channel|here|me] [N]`"""
+    await next_spawns(bot, ctx, *args)
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
+
+@bot.command(name="remind")
+async def command_remind(ctx, *args):
+    """Sets your 🔔 reminder times via `!remind 30 15 5 [dm]`"""
+    await remind(bot, ctx, *args)
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
 
 @bot.command(name="list")
 async def command_list(ctx):
     """Handles listing all items via `!list`"""
     await list_items(ctx)
-    try:
-        await ctx.message.delete()  # ✅ Delete the user command after execution
-    except discord.NotFound:
-        print("⚠️ Warning: Command message was already deleted.")
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
 
 @bot.command(name="add")
 async def command_add(ctx, item_name: str, duration: str):
@@ -153,4 +216,4 @@ async def command_del(ctx, item_name: str):
     await remove_item(ctx, item_name)
 
 # ✅ Start bot
-bot.run(config.TOKEN)
+bot.run(config.TOKEN, log_handler=None)  # ✅ discord.py logs go through our queue handler too
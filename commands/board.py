@@ -0,0 +1,53 @@
+import time
+import logging
+from events.board import board_channels, enable_board, disable_board
+from events.ping_manager import delete_pings_for_event
+from events.tracking import update_event, forget_event
+from utils.storage import event_store
+from utils.transient import transient_messages
+from utils.spawn_history import spawn_history, RESET
+
+BOARD_USAGE = "📜 **Usage:** `!board on`, `!board off`, `!board reset <n>`, `!board del <n>`"
+
+async def board_entry(bot, ctx, position):
+    """Returns the tracked record shown at `position` (1-based) on this channel's board, or None."""
+    if not position.isdigit():
+        return None
+    rows = await event_store.events_in_channel(ctx.channel.id)
+    index = int(position) - 1
+    if not 0 <= index < len(rows):
+        return None
+    return bot.messages_to_delete.get(rows[index]["message_id"])
+
+async def board(bot, ctx, *args):
+    """Manages board mode: one pinned, live list of upcoming spawns per channel."""
+    action = args[0].lower() if args else ""
+
+    if action == "on":
+        if not await enable_board(bot, ctx.channel):
+            await transient_messages.reply(ctx, "⚠️ **Board mode is already on in this channel.**")
+        return
+
+    if action == "off":
+        if not await disable_board(bot, ctx.channel):
+            await transient_messages.reply(ctx, "⚠️ **Board mode is not on in this channel.**")
+        return
+
+    if action in ("reset", "del") and ctx.channel.id in board_channels:
+        record = await board_entry(bot, ctx, args[1] if len(args) > 1 else "")
+        if not record:
+            await transient_messages.reply(ctx, "❌ **No board entry with that number!**")
+            return
+
+        if action == "reset":
+            await delete_pings_for_event(bot, record.message_id)
+            spawn_history.record(RESET, record)  # ✅ Logged with the pre-reset spawn time
+            record.spawn_time = int(time.time()) + record.original_duration  # ✅ Full reset
+            await update_event(bot, record)
+            logging.info(f"🔄 {ctx.author.display_name} reset board entry {record.item_name} in {ctx.channel.name}")
+        else:
+            await forget_event(bot, record.message_id)
+            logging.info(f"🗑️ {ctx.author.display_name} removed board entry {record.item_name} in {ctx.channel.name}")
+        return
+
+    await transient_messages.reply(ctx, BOARD_USAGE)
@@ -0,0 +1,100 @@
+import time
+import logging
+import discord
+from events.event_record import EventRecord
+from events.tracking import track_event, update_event
+from events.ping_manager import delete_reminder_messages, schedule_event_ping
+from utils.bosses import boss_catalog, zone_timers
+from events.controls import send_event_message
+from utils.storage import event_store
+from utils import rest
+from utils.transient import transient_messages
+
+ZONE_COLOR = "💀"
+
+def format_duration(seconds):
+    """Formats respawn seconds as `1h 29m` / `45m`."""
+    hours, minutes = seconds // 3600, (seconds % 3600) // 60
+    if hours and minutes:
+        return f"{hours}h {minutes}m"
+    return f"{hours}h" if hours else f"{minutes}m"
+
+def render_zone_text(zone, timers, actor, action="Posted"):
+    """Builds the consolidated zone message, soonest respawn first."""
+    lines = [
+        f"{ZONE_COLOR} **{zone.title()}** ({len(timers)} boss{'es' if len(timers) != 1 else ''}) {ZONE_COLOR}",
+        f"👤 **{action} by: {actor}**",
+    ]
+    for boss, (respawn, spawn_time) in sorted(timers.items(), key=lambda item: item[1][1]):
+        lines.append(f"⚔️ **{boss}** — <t:{spawn_time}:R> (<t:{spawn_time}:t>, every {format_duration(respawn)})")
+    return "\n".join(lines)
+
+async def boss(bot, ctx, *args):
+    """Starts respawn timers for a whole zone (or a subset of its bosses) in one message."""
+    if not args:
+        zones = "\n".join(
+            f"🔹 **{zone.title()}** - {len(bosses)} bosses" for zone, bosses in boss_catalog.zones.items()
+        )
+        await transient_messages.reply(ctx, f"📜 **Usage:** `!boss <zone> [boss ...]` or `!boss <boss>`\n{zones}")
+        return
+
+    zone, terms = boss_catalog.split_zone(args)
+    if not zone:
+        # ✅ `!boss <boss name>` without a zone: one indexed lookup
+        found = boss_catalog.find_boss(" ".join(args))
+        if not found:
+            await transient_messages.reply(ctx, f"❌ **Unknown zone or boss:** {' '.join(args)}. Use `!boss` to list zones.")
+            return
+        zone, name = found
+        selected, unmatched = {name: boss_catalog.zones[zone][name]}, []
+    else:
+        selected, unmatched = boss_catalog.select(zone, terms)
+    if unmatched or not selected:
+        await transient_messages.reply(ctx, f"❌ **No boss in {zone.title()} matches:** {', '.join(unmatched) or ' '.join(terms)}")
+        return
+
+    now = int(time.time())
+    timers = {name: (respawn, now + respawn) for name, respawn in selected.items()}
+    # ✅ One message, three controls for the whole zone
+    message = await send_event_message(ctx, render_zone_text(zone, timers, ctx.author.display_name), ["✅", "🗑️", "🔔"])
+
+    zone_timers[message.id] = timers
+    await track_event(bot, EventRecord.for_message(
+        message,
+        spawn_time=min(spawn_time for _, spawn_time in timers.values()),
+        original_duration=min(respawn for respawn, _ in timers.values()),
+        negative_offset=0,
+        item_name=zone.title(),
+        rarity_name="",
+        color=ZONE_COLOR,
+        amount=len(timers),
+        creator_name=ctx.author.display_name,
+    ), message)
+    await event_store.save_boss_timers(message.id, timers)
+    logging.info(f"💀 Started {len(timers)} boss timers for {zone} (message {message.id})")
+
+async def reset_zone(bot, message, user, rearm_reaction=True):
+    """✅ on a zone message: restarts every boss timer and edits the message in place."""
+    timers = zone_timers.get(message.id)
+    record = bot.messages_to_delete.get(message.id)
+    if not timers or not record:
+        return
+
+    now = int(time.time())
+    timers = {name: (respawn, now + respawn) for name, (respawn, _) in timers.items()}
+    await rest.edit(message, content=render_zone_text(record.item_name, timers, user.display_name, "Reset"))
+    zone_timers[message.id] = timers  # ✅ Only after the edit went through
+    record.spawn_time = min(spawn_time for _, spawn_time in timers.values())
+    if rearm_reaction:
+        try:
+            await rest.remove_reaction(message, "✅", user)  # ✅ Re-arm the reset button
+        except (discord.Forbidden, discord.NotFound):
+            pass
+
+    await update_event(bot, record)
+    await event_store.save_boss_timers(message.id, timers)
+
+    # ✅ Subscribers keep their 🔔, so move their reminder to the new deadline
+    await delete_reminder_messages(bot, message.id)
+    schedule_event_ping(bot, message.id)
+    logging.info(f"🔄 {user.display_name} reset zone {record.item_name} (message {message.id})")
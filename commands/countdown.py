@@ -1,52 +1,58 @@
+import asyncio
+import re
 import time
-import discord
+from collections import namedtuple
 import config
 import logging
-import aiohttp
-import io
-from utils.helpers import load_items
-
-async def repost_image(ctx, attachment):
-    """Downloads and re-uploads an image properly to prevent embed issues."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(attachment.url) as resp:
-            if resp.status == 200:
-                image_data = await resp.read()
-                file = discord.File(io.BytesIO(image_data), filename=attachment.filename)
-                return file
-    return None
-
-async def cd(bot, ctx, *args):
-    """Handles event creation and tracking with optional images and negative time adjustments."""
-
-    if not args:
-        error_message = await ctx.send("❌ **Error:** You must specify an item name and time! Example: `!cd willow 2h`")
-        await error_message.add_reaction("🗑️")
-        bot.error_messages[error_message.id] = ctx.message  # ✅ Store error message & user's command
-        return
-
-    item_name = args[0].lower().strip()
+from utils.catalog import item_catalog
+from events.tracking import track_event
+from events.event_record import EventRecord, countdown_text
+from events.board import board_channels
+from events.controls import control_emojis, send_event_message
+from utils.attachment_cache import attachment_cache
+from utils.transient import transient_messages
+from utils.spawn_history import spawn_history, CREATE
+from utils.storage import event_store
+
+DURATION_UNITS = {"h": 3600, "m": 60, "s": 1}
+SPEC_SEPARATORS = re.compile(r"[;\n]")
+MAX_BATCH = 20  # ✅ Timers accepted from one !cd message
+CD_USAGE_ERROR = "❌ **Error:** You must specify an item name and time! Example: `!cd willow 2h`"
+
+# ✅ One timer request parsed from `!cd <item> [time] [rarity/amount] [-offset]`
+TimerSpec = namedtuple("TimerSpec", "item_name duration rarity amount negative_offset")
+
+def split_specs(ctx, args):
+    """Splits one `!cd` invocation into per-timer token lists (timers separated by `;` or newlines)."""
+    content = ctx.message.content or ""
+    if ";" not in content and "\n" not in content:
+        return [list(args)]
+
+    parts = content.split(None, 1)  # ✅ Drop the "!cd" itself; discord.py's args lose the newlines
+    body = parts[1] if len(parts) > 1 else ""
+    return [tokens for tokens in (spec.split() for spec in SPEC_SEPARATORS.split(body)) if tokens]
+
+def parse_spec(tokens):
+    """Parses one timer's tokens in a single pass."""
+    item_name = tokens[0].lower().strip()
     duration = None
     rarity = None
     amount = 1
     negative_offset = 0
-    duration_mapping = {"h": 3600, "m": 60, "s": 1}
 
-    # ✅ Parse Arguments
-    for arg in args[1:]:
+    for arg in tokens[1:]:
         arg = arg.lower()
 
-        if arg[-1] in duration_mapping and arg[:-1].isdigit():
+        if arg[-1] in DURATION_UNITS and arg[:-1].isdigit():
             if duration is None:
-                duration = int(arg[:-1]) * duration_mapping[arg[-1]]
+                duration = int(arg[:-1]) * DURATION_UNITS[arg[-1]]
             else:
                 logging.warning(f"⚠️ Ignored extra duration: {arg}")
             continue
 
         if any(c in "curhel" for c in arg) and any(c.isdigit() for c in arg):
-            rarity_letter = next(c for c in arg if c in "curhel")
+            rarity = next(c for c in arg if c in "curhel")
             amount_digits = "".join(filter(str.isdigit, arg))
-            rarity = rarity_letter
             amount = int(amount_digits) if amount_digits else 1
             continue
 
@@ -62,70 +68,121 @@ async def cd(bot, ctx, *args):
             negative_offset = int(arg[1:]) * 60
             continue
 
-    # ✅ Load stored items before checking
-    item_timers = load_items()
+    return TimerSpec(item_name, duration, rarity, amount, negative_offset)
 
-    # ✅ If no duration is provided, use stored duration
-    if duration is None:
-        if item_name in item_timers:
-            duration = item_timers[item_name]
-        else:
-            error_message = await ctx.send(f"❌ **{item_name.capitalize()}** is not stored! Use `!cd {item_name} <time>` first.")
-            await error_message.add_reaction("🗑️")  # ✅ Add trash bin reaction
-            bot.error_messages[error_message.id] = ctx.message  # ✅ Store error message & user's command
-            return  # ✅ Stop execution if item is not found
+async def cd(bot, ctx, *args):
+    """Handles event creation and tracking with optional images and negative time adjustments.
 
-    original_duration = duration  # ✅ Store original full duration for resets
-    countdown_time = int(time.time()) + duration - negative_offset  # ✅ Preserve negative offset
+    Several timers can be created at once: `!cd iron; copper -5; willow r3` (or one per line).
+    """
 
-    image_file = None
+    specs = [parse_spec(tokens) for tokens in split_specs(ctx, args)] if args else []
+    if not specs:
+        await transient_messages.reply(ctx, CD_USAGE_ERROR)  # ✅ Also `!cd ;`, which splits into nothing
+        return
 
-    # ✅ If the user uploaded an image, save it as a file
+    if len(specs) > MAX_BATCH:
+        dropped = specs[MAX_BATCH:]
+        logging.warning(f"⚠️ Ignored {len(dropped)} timers over the batch limit")
+        names = ", ".join(f"**{spec.item_name.capitalize()}**" for spec in dropped)
+        await transient_messages.reply(ctx, f"⚠️ At most {MAX_BATCH} timers per `!cd`, so these were skipped: {names}")
+        specs = specs[:MAX_BATCH]
+
+    # ✅ If no duration is provided, use stored duration (one catalog lookup for the whole batch)
+    stored = item_catalog.get_many([spec.item_name for spec in specs if spec.duration is None])
+    unknown = [name for name, duration in stored.items() if duration is None]
+    if unknown:
+        names = ", ".join(f"**{name.capitalize()}**" for name in unknown)
+        example = unknown[0]
+        await transient_messages.reply(ctx, f"❌ {names} {'is' if len(unknown) == 1 else 'are'} not stored! Use `!cd {example} <time>` first.")
+
+    specs = [spec if spec.duration is not None else spec._replace(duration=stored[spec.item_name])
+             for spec in specs if spec.duration is not None or stored[spec.item_name] is not None]
+    if not specs:
+        return  # ✅ Stop execution if no item is found
+
+    now = int(time.time())
+
+    # ✅ Board mode: no per-event message, the events only show up on the channel's board
+    if ctx.channel.id in board_channels:
+        # ✅ Board events have no message: negative IDs from a shared sequence can't collide with snowflakes
+        first_id = await event_store.allocate_ids("board_events", len(specs))
+        for index, spec in enumerate(specs):
+            record = board_record(ctx, -(first_id + index), spec, now)
+            spawn_history.record(CREATE, record, now)
+            await track_event(bot, record)
+        return
+
+    # ✅ If the user uploaded an image, save it as a file (kept in the attachment cache for reposts);
+    # in a batch it goes with the first timer
+    image = None
     if ctx.message.attachments:
-        image_file = await ctx.message.attachments[0].to_file()
+        image = await attachment_cache.get_file(ctx.message.attachments[0])
+
+    # ✅ Pipelined: every post is queued at once and the REST workers send them concurrently
+    results = await asyncio.gather(
+        *(post_timer(bot, ctx, spec, now, image if index == 0 else None) for index, spec in enumerate(specs)),
+        return_exceptions=True,
+    )
+    failed = []
+    for spec, result in zip(specs, results):
+        if isinstance(result, Exception):
+            logging.error(f"❌ Failed to post timer for {spec.item_name}: {result}")
+            failed.append(spec.item_name.capitalize())
+    if failed:
+        names = ", ".join(f"**{name}**" for name in failed)
+        await transient_messages.reply(ctx, f"❌ Couldn't post {'this timer' if len(failed) == 1 else 'these timers'}, please try again: {names}")
+
+def rarity_display(spec):
+    """Returns (rarity_name, color) for a spec, defaulting to no rarity and white dots."""
+    if spec.rarity:
+        return config.RARITY_COLORS.get(spec.rarity, ("Rare", "🔵"))  # ✅ Use correct rarity letter
+    return "", "⚪"
+
+def board_record(ctx, event_id, spec, now):
+    rarity_name, color = rarity_display(spec)
+    return EventRecord(
+        message_id=event_id,
+        guild_id=ctx.guild.id if ctx.guild else None,
+        channel_id=ctx.channel.id,
+        spawn_time=now + spec.duration - spec.negative_offset,
+        original_duration=spec.duration,
+        negative_offset=spec.negative_offset,
+        item_name=spec.item_name.capitalize(),
+        rarity_name=rarity_name,
+        color=color,
+        amount=spec.amount,
+        creator_name=ctx.author.display_name,
+    )
+
+async def post_timer(bot, ctx, spec, now, image=None):
+    """Posts one countdown message, seeds its reactions and starts tracking it."""
+    original_duration = spec.duration  # ✅ Store original full duration for resets
+    countdown_time = now + spec.duration - spec.negative_offset  # ✅ Preserve negative offset
 
     # ✅ Determine rarity color dynamically
-    if rarity:
-        rarity_name, color = config.RARITY_COLORS.get(rarity, ("Rare", "🔵"))  # ✅ Use correct rarity letter
-        rarity_display = f"{rarity_name} "
-        amount_display = f"{amount}x " if amount > 1 else ""
-    else:
-        rarity_name, color = "", "⚪"  # ✅ Default: No rarity name, white dots
-        rarity_display = ""
-        amount_display = f"{amount}x " if amount > 1 else ""  # ✅ Still show amount if > 1
+    rarity_name, color = rarity_display(spec)
 
     # ✅ Build countdown message
-    countdown_text = (
-        f"{color} **{amount_display}{rarity_display}{item_name.capitalize()}** {color}\n"
-        f"👤 **Posted by: {ctx.author.display_name}**\n"
-        f"⏳ **Next spawn at** <t:{countdown_time}:F>\n"
-        f"⏳ **Countdown:** <t:{countdown_time}:R>\n"
-        f"⏳ **Interval:** {original_duration // 3600}h"
-    )
-
-    if original_duration % 3600 != 0:
-        countdown_text += f" {original_duration % 3600 // 60}m"
-
-    if image_file:
-        message = await ctx.send(countdown_text, file=image_file)  # ✅ Upload image file instead of using embed
-    else:
-        message = await ctx.send(countdown_text)
-
-    # ✅ Always add reset and delete reactions
-    await message.add_reaction("✅")  # Reset event
-    await message.add_reaction("🗑️")  # Delete event
-    await message.add_reaction("🔔")  # ✅ Add ping reaction
-
-    # ✅ Check if the event is in a shared gathering channel
-    if ctx.channel.name in config.GATHERING_CHANNELS.values():
-        await message.add_reaction("📥")  # Add claim reaction in shared channels
-    else:
-        for emoji in config.GATHERING_CHANNELS.keys():
-            await message.add_reaction(emoji)  # ✅ Add sharing reactions (⛏️, 🌲, 🌿)
-
-    # ✅ Store message details, including the original duration and image URL
-    bot.messages_to_delete[message.id] = (
-        message, original_duration, duration - negative_offset, negative_offset,
-        item_name.capitalize(), rarity_name, color, amount, ctx.channel.id, ctx.author.display_name,
-        image_file  # ✅ Store the actual image file for reuse!
+    event_text = countdown_text(spec.item_name.capitalize(), rarity_name, color, spec.amount,
+                                ctx.author.display_name, countdown_time, original_duration)
+
+    # ✅ Reset, delete and ping always; claim in shared gathering channels, sharing (⛏️, 🌲, 🌿) elsewhere
+    image_file, image_hash = image if image else (None, None)
+    message = await send_event_message(ctx, event_text, control_emojis(ctx.channel), file=image_file)  # ✅ Upload image file instead of using embed
+
+    # ✅ Store event details: absolute spawn time, original duration and a reference to the image
+    record = EventRecord.for_message(
+        message,
+        spawn_time=countdown_time,
+        original_duration=original_duration,
+        negative_offset=spec.negative_offset,
+        item_name=spec.item_name.capitalize(),
+        rarity_name=rarity_name,
+        color=color,
+        amount=spec.amount,
+        creator_name=ctx.author.display_name,
+        image_hash=image_hash if message.attachments else None,
     )
+    spawn_history.record(CREATE, record, now)
+    await track_event(bot, record, message)
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from commands.bosses import format_duration
+from utils.catalog import item_catalog
+from utils.spawn_history import spawn_history, analyze, suggestions
+from utils.transient import transient_messages
+
+INTERVALS_USAGE = "📜 **Usage:** `!intervals [item]` to show observed respawn intervals, `!intervals apply` to update stored durations"
+
+async def intervals(bot, ctx, *args):
+    """Shows per-item respawn intervals observed from resets and can apply them to the catalog."""
+    action = args[0].lower() if args else ""
+
+    await spawn_history.flush()  # ✅ Include the latest resets
+    stats = await asyncio.get_running_loop().run_in_executor(None, analyze)  # ✅ NumPy work off the event loop
+    if not stats:
+        await transient_messages.reply(ctx, "📜 **No resets recorded yet.** Intervals are learned from ✅ resets.")
+        return
+
+    catalog = item_catalog.items()
+    suggested = suggestions(stats, catalog)
+
+    if action == "apply":
+        for name, (stored, duration) in suggested.items():
+            item_catalog.set(name, duration)
+            logging.info(f"📐 {ctx.author.display_name} applied observed interval for {name}: {stored}s -> {duration}s")
+        if not suggested:
+            await transient_messages.reply(ctx, "✅ **Stored durations already match the observed intervals.**")
+            return
+        lines = ["📐 **Updated durations:**"] + [
+            f"🔹 **{name.capitalize()}** {format_duration(stored)} → {format_duration(duration)}"
+            for name, (stored, duration) in sorted(suggested.items())
+        ]
+        await transient_messages.reply(ctx, "\n".join(lines))
+        return
+
+    if action and action not in stats:
+        await transient_messages.reply(ctx, f"⚠️ **No resets recorded for {action.capitalize()}.**\n{INTERVALS_USAGE}")
+        return
+
+    lines = ["📐 **Observed respawn intervals** (from ✅ resets)"]
+    for name in ([action] if action else sorted(stats, key=lambda n: -stats[n]["samples"])):
+        item_stats = stats[name]
+        stored = catalog.get(name)
+        line = (
+            f"🔹 **{name.capitalize()}** — {item_stats['samples']} resets, median {format_duration(item_stats['median'])}, "
+            f"p90 {format_duration(item_stats['p90'])}, {item_stats['outliers']} outliers"
+        )
+        if stored is not None:
+            line += f" · stored {format_duration(stored)}"
+        if name in suggested:
+            line += f" → suggest **{format_duration(suggested[name][1])}**"
+        lines.append(line)
+    if suggested:
+        lines.append("Use `!intervals apply` to update the suggested durations.")
+    await transient_messages.reply(ctx, "\n".join(lines))
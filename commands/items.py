@@ -1,30 +1,7 @@
 import logging
-import json
-import os
-import discord
-
-ITEMS_FILE = "items.json"
-
-# ✅ Load items from file
-def load_items():
-    """Loads items from JSON file."""
-    if not os.path.exists(ITEMS_FILE):
-        return {}
-    try:
-        with open(ITEMS_FILE, "r") as file:
-            return json.load(file)
-    except json.JSONDecodeError:
-        logging.warning("⚠️ Failed to decode items.json! Resetting storage.")
-        return {}
-
-# ✅ Save items to file
-def save_items(data):
-    """Saves items to JSON file."""
-    with open(ITEMS_FILE, "w") as file:
-        json.dump(data, file, indent=4)
-
-# ✅ Initialize items storage
-item_timers = load_items()
+from utils.catalog import item_catalog
+from utils import rest
+from utils.transient import transient_messages
 
 async def add_item(ctx, item_name: str, duration_str: str):
     """Adds a new item with a duration in hours/minutes."""
@@ -40,55 +17,39 @@ async def add_item(ctx, item_name: str, duration_str: str):
             if value[-1] in duration_mapping and value[:-1].isdigit()
         )
     except ValueError:
-        response = await ctx.send("❌ **Invalid time format!** Use `h/m` (e.g., `1h 30m`).")
-        await response.add_reaction("🗑️")
+        await transient_messages.reply(ctx, "❌ **Invalid time format!** Use `h/m` (e.g., `1h 30m`).")
         return
 
-    # ✅ Save to JSON
-    item_timers[item_name] = duration
-    save_items(item_timers)  # **Missing in your previous code!**
+    # ✅ Save to the catalog (persisted to items.json in the background)
+    item_catalog.set(item_name, duration)
 
     hours = duration // 3600
     minutes = (duration % 3600) // 60
     duration_text = f"{hours}h {minutes}m" if minutes else f"{hours}h"
 
     logging.info(f"✅ Added item: {item_name} with duration {duration_text}")
-    response = await ctx.send(f"✅ **Added:** {item_name.capitalize()} - {duration_text}")
-    await response.add_reaction("🗑️")
+    await transient_messages.reply(ctx, f"✅ **Added:** {item_name.capitalize()} - {duration_text}", with_command=False)
     # ✅ Delete the user's command message
-    try:
-        await ctx.message.delete()
-    except discord.NotFound:
-        logging.warning("⚠️ Warning: Command message was already deleted.")
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
 
 async def remove_item(ctx, item_name: str):
     """Removes an item from the list."""
     item_name = item_name.lower().strip()
 
-    if item_name in item_timers:
-        del item_timers[item_name]
-        save_items(item_timers)  # **Make sure the item is removed from storage!**
-
-        response = await ctx.send(f"🗑️ **Removed:** {item_name.capitalize()}")
-        await response.add_reaction("🗑️")
+    if item_catalog.remove(item_name):
+        await transient_messages.reply(ctx, f"🗑️ **Removed:** {item_name.capitalize()}", with_command=False)
     else:
-        response = await ctx.send(f"⚠️ **Item not found:** {item_name.capitalize()}")
-        await response.add_reaction("🗑️")
+        await transient_messages.reply(ctx, f"⚠️ **Item not found:** {item_name.capitalize()}", with_command=False)
 
     # ✅ Delete the user's command message
-    try:
-        await ctx.message.delete()
-    except discord.NotFound:
-        logging.warning("⚠️ Warning: Command message was already deleted.")
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
 
 async def list_items(ctx):
     """Displays all stored items and their durations, splitting into multiple messages if needed."""
-    global item_timers
-    item_timers = load_items()  # ✅ Reload the latest data
+    item_timers = item_catalog.items()  # ✅ In-memory snapshot, no file I/O
 
     if not item_timers:
-        response = await ctx.send("📜 **No items stored!** Use `!add <item> <duration>` to store one.")
-        await response.add_reaction("🗑️")  # ✅ Trash bin reaction
+        await transient_messages.reply(ctx, "📜 **No items stored!** Use `!add <item> <duration>` to store one.", with_command=False)
         return
 
     unique_items = {}  # ✅ Dictionary to store unique items
@@ -130,19 +91,15 @@ async def list_items(ctx):
 
     # ✅ Send each chunk as a separate message
     for chunk in message_chunks:
-        msg = await ctx.send(chunk)
+        msg = await rest.send(ctx, chunk)
         sent_messages.append(msg)
 
     # ✅ Add a 🗑️ reaction to the last message for bulk deletion
     if sent_messages:
-        await sent_messages[-1].add_reaction("🗑️")
+        rest.fire_and_forget(rest.add_reaction(sent_messages[-1], "🗑️"))
 
-    # ✅ Store the messages for deletion handling
-    bot = ctx.bot
-    bot.list_messages_to_delete = sent_messages
+    # ✅ 🗑️ on the last page (or the TTL) removes all pages at once
+    transient_messages.register(*sent_messages)
 
     # ✅ Delete the user's command message
-    try:
-        await ctx.message.delete()
-    except discord.NotFound:
-        logging.warning("⚠️ Warning: Command message was already deleted.")
+    rest.fire_and_forget(rest.delete(ctx.message))  # ✅ Not awaited: CLEANUP queues behind everything else
@@ -0,0 +1,52 @@
+import config
+from events.ping_manager import ping_preferences, set_ping_preference, MAX_LEAD_TIMES
+from utils.transient import transient_messages
+
+MAX_LEAD_MINUTES = 24 * 60
+REMIND_USAGE = "📜 **Usage:** `!remind 30 15 5 [dm]` · `!remind dm` · `!remind channel` · `!remind reset`"
+
+def describe(leads, dm):
+    minutes = [str(lead // 60) for lead in leads]
+    text = minutes[0] if len(minutes) == 1 else ", ".join(minutes[:-1]) + " and " + minutes[-1]
+    return f"**{text} minutes** before spawns, {'by DM' if dm else 'in the event channel'}"
+
+def parse_remind_args(args):
+    """Returns (lead times in seconds or None to keep them, dm or None to keep it, reset)."""
+    leads, dm = [], None
+    for arg in (arg.lower().strip(",") for arg in args):
+        if arg in ("reset", "default"):
+            return None, None, True
+        if arg == "dm":
+            dm = True
+        elif arg in ("channel", "here"):
+            dm = False
+        elif arg.removesuffix("m").isdigit() and 0 < int(arg.removesuffix("m")) <= MAX_LEAD_MINUTES:
+            leads.append(int(arg.removesuffix("m")) * 60)
+        else:
+            raise ValueError(arg)
+    return leads or None, dm, False
+
+async def remind(bot, ctx, *args):
+    """Shows or sets the caller's 🔔 reminder lead times and delivery (channel or DM)."""
+    user_id = ctx.author.id
+    current_leads, current_dm = ping_preferences.get(user_id, (config.PING_LEAD_TIMES, False))
+
+    try:
+        leads, dm, reset = parse_remind_args(args)
+    except ValueError as e:
+        text = f"❌ **Invalid reminder time:** `{e}` (minutes, 1–{MAX_LEAD_MINUTES})\n{REMIND_USAGE}"
+    else:
+        if reset:
+            await set_ping_preference(bot, user_id, None, False)
+            text = f"🔔 Reminders reset to the default: {describe(config.PING_LEAD_TIMES, False)}."
+        elif leads is None and dm is None:
+            text = f"🔔 You are reminded {describe(current_leads, current_dm)}.\n{REMIND_USAGE}"
+        elif leads is not None and len(set(leads)) > MAX_LEAD_TIMES:
+            text = f"❌ **At most {MAX_LEAD_TIMES} reminder times.**"
+        else:
+            leads = sorted(set(leads or current_leads), reverse=True)
+            dm = current_dm if dm is None else dm
+            await set_ping_preference(bot, user_id, leads, dm)
+            text = f"🔔 You'll be reminded {describe(leads, dm)}."
+
+    await transient_messages.reply(ctx, text)
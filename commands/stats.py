@@ -0,0 +1,77 @@
+from events.ping_manager import ping_scheduler, ping_batcher
+from utils import metrics, rest
+from utils.attachment_cache import attachment_cache
+from utils.message_cache import message_cache
+from utils.seeding import reaction_seeder
+from utils.transient import transient_messages
+
+def register_gauges(bot):
+    """Registers the scrape-time gauges that need the bot's live state."""
+    metrics.Gauge("countdown_tracked_events", "Events currently tracked", lambda: len(bot.messages_to_delete))
+    metrics.Gauge("countdown_scheduled_pings", "Reminder timers pending", lambda: len(ping_scheduler))
+    metrics.Gauge("countdown_reminder_messages", "Messages sent for (coalesced) reminders", lambda: ping_batcher.stats["messages"])
+    metrics.Gauge("countdown_rest_queue_depth", "Queued REST calls by priority class",
+                  lambda: {rest.PRIORITY_NAMES[p]: depth for p, depth in rest.dispatcher.depth.items()}, label="priority")
+    metrics.Gauge("countdown_rest_wait_max_seconds", "Longest REST queue wait by priority class",
+                  lambda: {rest.PRIORITY_NAMES[p]: wait for p, wait in rest.dispatcher.wait_max.items()}, label="priority")
+    metrics.Gauge("countdown_message_cache_hits", "Reaction-path message cache hits", lambda: message_cache.hits)
+    metrics.Gauge("countdown_message_cache_misses", "Reaction-path message cache misses", lambda: message_cache.misses)
+    metrics.Gauge("countdown_attachment_cache_hits", "Attachment cache hits", lambda: attachment_cache.stats["hits"])
+    metrics.Gauge("countdown_attachment_cache_bytes_saved", "Download bytes avoided by the attachment cache",
+                  lambda: attachment_cache.stats["bytes_saved"])
+    metrics.Gauge("countdown_reaction_seeding_max_seconds", "Slowest per-message reaction seeding",
+                  lambda: reaction_seeder.stats["max_latency"])
+
+def _ms(seconds):
+    if seconds is None:
+        return "–"
+    return "∞" if seconds == float("inf") else f"≤{seconds * 1000:.0f}ms"
+
+def _latency_lines(histogram, label):
+    lines = []
+    for key in sorted(histogram.series):
+        labels = dict(key)
+        lines.append(
+            f"🔹 **{labels[label]}** × {histogram.count(**labels)} — p50 {_ms(histogram.quantile(0.5, **labels))}, "
+            f"p99 {_ms(histogram.quantile(0.99, **labels))}"
+        )
+    return lines
+
+def _rest_calls_per_operation():
+    calls = {}
+    for key, value in metrics.REST_CALLS.values.items():
+        operation = dict(key)["operation"]
+        calls[operation] = calls.get(operation, 0) + value
+    return calls
+
+async def stats(bot, ctx):
+    """Posts a snapshot of the bot's load: tracked events, latencies, REST usage and queues."""
+    seeded = reaction_seeder.stats["messages"]
+    avg_seed = reaction_seeder.stats["total_latency"] / seeded if seeded else 0.0
+    lag_p99 = metrics.SCHEDULER_LAG.quantile(0.99)
+
+    lines = [
+        "📈 **Bot stats**",
+        f"⏳ Tracked events: **{len(bot.messages_to_delete)}** · Pending pings: **{len(ping_scheduler)}**",
+        f"⏰ Scheduler lag p99: **{_ms(lag_p99)}**",
+        f"🔔 Reminders: **{ping_batcher.stats['reminders']}** delivered in {ping_batcher.stats['messages']} messages",
+        f"📮 REST queue: **{rest.dispatcher.queue_depth}** queued · {rest.dispatcher.stats['completed']} sent · "
+        f"{rest.dispatcher.stats['coalesced']} merged · {rest.dispatcher.stats['failed']} failed",
+        f"🗂️ Message cache hit rate: **{message_cache.hit_rate:.0%}** · "
+        f"Attachment cache hit rate: **{attachment_cache.hit_rate:.0%}** ({attachment_cache.stats['bytes_saved'] // 1024} KiB saved)",
+        f"🌱 Reaction seeding: avg **{avg_seed * 1000:.0f}ms** over {seeded} messages",
+        f"🧹 Expired events swept: **{sum(metrics.EVENTS_SWEPT.values.values())}**",
+    ]
+
+    command_lines = _latency_lines(metrics.COMMAND_LATENCY, "command")
+    if command_lines:
+        lines += ["**Commands:**"] + command_lines
+    reaction_lines = _latency_lines(metrics.REACTION_LATENCY, "action")
+    if reaction_lines:
+        lines += ["**Reactions:**"] + reaction_lines
+
+    calls = _rest_calls_per_operation()
+    if calls:
+        lines.append("**REST calls:** " + ", ".join(f"{op} {count}" for op, count in sorted(calls.items())))
+
+    await transient_messages.reply(ctx, "\n".join(lines))
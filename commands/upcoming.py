@@ -0,0 +1,65 @@
+import time
+from events.spawn_index import spawn_index
+from events.ping_manager import user_pings
+from events.intel_channels import intel_channels
+from utils.transient import transient_messages
+
+DEFAULT_COUNT = 5
+MAX_COUNT = 25
+NEXT_USAGE = "📜 **Usage:** `!next [item|#channel|here|me] [N]`"
+
+def parse_next_args(ctx, args):
+    """Returns (scope, value, count) for `!next [item|channel|me] [N]`."""
+    args = list(args)
+    count = DEFAULT_COUNT
+    if args and args[-1].isdigit():
+        count = max(1, min(MAX_COUNT, int(args.pop())))
+    if not args:
+        return "guild", None, count
+
+    target = " ".join(args).strip()
+    if target.lower() == "me":
+        return "me", None, count
+    if target.lower() == "here":
+        return "channel", ctx.channel, count
+    if ctx.message.channel_mentions:
+        return "channel", ctx.message.channel_mentions[0], count
+    channel = next((ch for ch in ctx.guild.text_channels if ch.name == target.lower()), None) if ctx.guild else None
+    if channel:
+        return "channel", channel, count
+    return "item", target, count
+
+async def next_spawns(bot, ctx, *args):
+    """Lists the next N upcoming spawns in the guild, a channel, for an item or for the caller."""
+    scope, value, count = parse_next_args(ctx, args)
+    now = int(time.time())
+    guild_id = ctx.guild.id if ctx.guild else None
+
+    if scope == "channel":
+        message_ids = spawn_index.next_in_channel(value.id, now, count)
+        title = f"in {value.mention}"
+    elif scope == "item":
+        message_ids = spawn_index.next_for_item(guild_id, value, now, count)
+        title = f"for **{value.capitalize()}**"
+    elif scope == "me":
+        # ✅ Your personal intel channel plus every event you have a 🔔 on
+        own_channel = intel_channels.get((guild_id, ctx.author.id))
+        subscribed = user_pings.get(ctx.author.id, ())
+        message_ids = spawn_index.next_among([own_channel] if own_channel else [], subscribed, now, count)
+        title = "for you"
+    else:
+        message_ids = spawn_index.next_in_guild(guild_id, now, count)
+        title = "in this server"
+
+    records = [bot.messages_to_delete[mid] for mid in message_ids if mid in bot.messages_to_delete]
+    if records:
+        lines = [f"⏭️ **Next spawns {title}:**"] + [
+            f"**{index}.** {record.color} **{record.item_name}** — <t:{record.spawn_time}:R> "
+            f"(<t:{record.spawn_time}:t>) in <#{record.channel_id}>"
+            for index, record in enumerate(records, start=1)
+        ]
+        text = "\n".join(lines)
+    else:
+        text = f"⏭️ **No upcoming spawns {title}.**\n{NEXT_USAGE}"
+
+    await transient_messages.reply(ctx, text)
@@ -21,3 +21,53 @@ RARITY_COLORS = {
     "e": ("Epic", "🟣"),    
     "l": ("Legendary", "🟠") 
 }
+
+# ✅ SQLite database used to persist events and ping subscriptions across restarts
+DATABASE_FILE = os.getenv("COUNTDOWN_DB", "countdown.db")
+
+# ✅ Disk cache for re-uploaded event screenshots
+ATTACHMENT_CACHE_DIR = os.getenv("ATTACHMENT_CACHE_DIR", "attachment_cache")
+ATTACHMENT_CACHE_BYTES = int(os.getenv("ATTACHMENT_CACHE_BYTES", 200 * 1024 * 1024))
+
+# ✅ Local Prometheus metrics endpoint (set METRICS_PORT=0 to disable)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", 9108))
+
+# ✅ Logging (written by a background thread, see utils/logging_setup.py)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.getenv("LOG_FILE", "bot_debug.log")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", 5))
+LOG_ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN", "")  # ✅ e.g. "midnight" for daily files instead of size-based
+LOG_DEBUG_SAMPLE = int(os.getenv("LOG_DEBUG_SAMPLE", 1))  # ✅ Keep 1 in N DEBUG records
+
+# ✅ Sharding: SHARD_COUNT=0 runs a single unsharded bot. With SHARD_COUNT set, SHARD_IDS
+# (e.g. "0,2") picks the shards this process connects; unset means all of them.
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", 0))
+SHARD_IDS = [int(shard) for shard in os.getenv("SHARD_IDS", "").split(",") if shard.strip()] or None
+
+# ✅ How ✅ resets an event: "repost" sends a fresh message and deletes the old one,
+# "edit" edits the existing message in place (keeps reactions and attachment)
+RESET_MODE = os.getenv("RESET_MODE", "repost").lower()
+
+# ✅ Expiry sweeper: events are forgotten EXPIRY_GRACE seconds after they spawned.
+# EXPIRY_ACTION decides what happens to their messages: "keep", "mark" (edit) or "delete" (bulk).
+EXPIRY_GRACE = int(os.getenv("EXPIRY_GRACE", 6 * 3600))
+SWEEP_INTERVAL = int(os.getenv("SWEEP_INTERVAL", 300))  # ✅ 0 disables the sweeper
+EXPIRY_ACTION = os.getenv("EXPIRY_ACTION", "keep").lower()
+
+# ✅ Errors, !list pages and confirmations are removed after TRANSIENT_TTL seconds (or on 🗑️)
+TRANSIENT_TTL = int(os.getenv("TRANSIENT_TTL", 15 * 60))
+TRANSIENT_SWEEP_INTERVAL = int(os.getenv("TRANSIENT_SWEEP_INTERVAL", 30))
+
+# ✅ Append-only log of creates/resets/shares/claims used by !intervals
+SPAWN_HISTORY_FILE = os.getenv("SPAWN_HISTORY_FILE", "spawn_history.bin")
+
+# ✅ 🔔 reminders: default lead times (minutes before spawn, overridable per user with !remind)
+# and how long to collect reminders for one channel/DM into a single message
+PING_LEAD_TIMES = tuple(int(minutes) * 60 for minutes in os.getenv("PING_LEAD_MINUTES", "15").split(",") if minutes.strip())
+PING_BATCH_WINDOW = float(os.getenv("PING_BATCH_WINDOW", 5))
+
+# ✅ Event controls: "reactions" (seeded emoji reactions) or "buttons" (one persistent
+# component row per message, no seeding; clicks carry the message and member)
+UI_MODE = os.getenv("UI_MODE", "reactions").lower()
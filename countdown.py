@@ -6,6 +6,7 @@ import re
 from datetime import datetime
 from discord.ext import commands
 from dotenv import load_dotenv
+from utils.helpers import load_items
 
 # ✅ Load environment variables
 load_dotenv()
@@ -22,23 +23,6 @@ intents.members = True
 # ✅ Initialize bot
 bot = commands.Bot(command_prefix="!", intents=intents)
 
-# ✅ Load & Save Functions for Items
-ITEMS_FILE = "items.json"
-
-def load_items():
-    """Load items from a JSON file."""
-    if os.path.exists(ITEMS_FILE):
-        with open(ITEMS_FILE, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-                return {key.lower().strip(): value for key, value in data.items()}  
-            except json.JSONDecodeError:
-                print("❌ ERROR: Could not decode JSON file.")
-                return {}
-    else:
-        print(f"❌ ERROR: {ITEMS_FILE} not found.")
-    return {}
-
 # ✅ Load saved items on startup
 item_timers = load_items()
 
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import time
+import discord
+from utils.storage import event_store
+from utils import rest
+
+BOARD_EDIT_INTERVAL = 5  # ✅ At most one board edit per channel every N seconds
+BOARD_HEADER = "📋 **Upcoming spawns**"
+
+# ✅ Channels in board mode: {channel ID: board message ID}
+board_channels = {}
+
+_last_edit = {}  # ✅ channel ID -> monotonic time of the last board edit
+_pending = {}  # ✅ channel ID -> scheduled edit task
+
+def render_board(rows, now=None):
+    """Renders event store rows (sorted by spawn time) as the board text."""
+    now = int(now if now is not None else time.time())
+    if not rows:
+        return f"{BOARD_HEADER}\n_No active timers. Use `!cd <item>` to add one._"
+
+    lines = [BOARD_HEADER]
+    length = len(BOARD_HEADER)
+    for index, row in enumerate(rows, start=1):
+        amount = f"{row['amount']}x " if row["amount"] and row["amount"] > 1 else ""
+        rarity = f"{row['rarity_name']} " if row["rarity_name"] else ""
+        status = "✅ **Spawned**" if row["spawn_time"] <= now else f"<t:{row['spawn_time']}:R>"
+        line = f"**{index}.** {row['color']} **{amount}{rarity}{row['item_name']}** — {status} (<t:{row['spawn_time']}:t>) · {row['creator_name']}"
+
+        if length + len(line) + 40 > 2000:  # ✅ Keep room for the overflow note
+            lines.append(f"_…and {len(rows) - index + 1} more_")
+            break
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+def mark_board_dirty(bot, channel_id):
+    """Schedules a coalesced board re-render; many changes within the interval become one edit."""
+    if channel_id not in board_channels:
+        return
+    task = _pending.get(channel_id)
+    if task is None or task.done():
+        _pending[channel_id] = asyncio.create_task(_edit_later(bot, channel_id))
+
+async def _edit_later(bot, channel_id):
+    wait = _last_edit.get(channel_id, 0) + BOARD_EDIT_INTERVAL - time.monotonic()
+    if wait > 0:
+        await asyncio.sleep(wait)
+    _pending.pop(channel_id, None)  # ✅ Changes from here on schedule a fresh edit
+    await refresh_board(bot, channel_id)
+
+async def refresh_board(bot, channel_id):
+    """Re-renders a channel's board from the event store and edits it in place."""
+    board_id = board_channels.get(channel_id)
+    channel = bot.get_channel(channel_id)
+    if not board_id or not channel:
+        return
+
+    _last_edit[channel_id] = time.monotonic()
+    rows = await event_store.events_in_channel(channel_id)
+    try:
+        await rest.edit(channel.get_partial_message(board_id), content=render_board(rows))
+    except discord.NotFound:
+        logging.warning(f"⚠️ Board message in {channel.name} was deleted, disabling board mode.")
+        await disable_board(bot, channel)
+    except discord.HTTPException as e:
+        logging.error(f"❌ Failed to update board in {channel.name}: {e}")
+
+async def enable_board(bot, channel):
+    """Posts and pins the board message for a channel."""
+    if channel.id in board_channels:
+        return False
+    rows = await event_store.events_in_channel(channel.id)
+    message = await rest.send(channel, render_board(rows))
+    try:
+        await rest.pin(message)
+    except discord.HTTPException:
+        logging.warning(f"⚠️ Could not pin the board in {channel.name}")
+
+    board_channels[channel.id] = message.id
+    _last_edit[channel.id] = time.monotonic()
+    await event_store.save_board(channel.id, message.id)
+    logging.info(f"📋 Board mode enabled in {channel.name}")
+    return True
+
+async def disable_board(bot, channel):
+    """Removes a channel's board message and leaves board mode; its events are reposted as messages."""
+    board_id = board_channels.pop(channel.id, None)
+    if board_id is None:
+        return False
+
+    task = _pending.pop(channel.id, None)
+    if task and task is not asyncio.current_task():
+        task.cancel()
+    _last_edit.pop(channel.id, None)
+    await event_store.delete_board(channel.id)
+
+    try:
+        await rest.delete(channel.get_partial_message(board_id))
+    except discord.HTTPException:
+        pass
+    bot.dispatch("board_disabled", channel)  # ✅ Handled in bot.py by tracking.post_board_events
+    logging.info(f"📋 Board mode disabled in {channel.name}")
+    return True
@@ -0,0 +1,61 @@
+import discord
+import config
+from utils.seeding import reaction_seeder
+from utils import rest
+
+# ✅ Button custom_ids are fixed per action: the clicked message *is* the event, so one
+# persistent view registered at startup routes clicks on every event message ever posted
+CUSTOM_ID_PREFIX = "countdown:"
+ACTION_IDS = {"✅": "reset", "🗑️": "delete", "🔔": "ping", "📥": "claim"}
+ACTION_LABELS = {"✅": "Reset", "🗑️": "Delete", "🔔": "Ping me", "📥": "Claim"}
+ACTION_STYLES = {"✅": discord.ButtonStyle.success, "🗑️": discord.ButtonStyle.danger}
+
+def control_emojis(channel):
+    """The actions offered on an event message in `channel` (same set for reactions and buttons)."""
+    emojis = ["✅", "🗑️", "🔔"]
+    if channel.name in config.GATHERING_CHANNELS.values():
+        emojis.append("📥")  # ✅ Claim in shared channels
+    else:
+        emojis.extend(config.GATHERING_CHANNELS.keys())  # ✅ Sharing (⛏️, 🌲, 🌿) everywhere else
+    return emojis
+
+def custom_id(emoji):
+    if emoji in config.GATHERING_CHANNELS:
+        return f"{CUSTOM_ID_PREFIX}share:{config.GATHERING_CHANNELS[emoji]}"
+    return CUSTOM_ID_PREFIX + ACTION_IDS[emoji]
+
+
+class ControlButton(discord.ui.Button):
+    """One event action; clicks are dispatched to the bot as `on_event_control(interaction, emoji)`."""
+
+    def __init__(self, emoji):
+        label = ACTION_LABELS.get(emoji) or f"Share to {config.GATHERING_CHANNELS[emoji]}"
+        super().__init__(
+            style=ACTION_STYLES.get(emoji, discord.ButtonStyle.secondary),
+            label=label, emoji=emoji, custom_id=custom_id(emoji),
+        )
+        self.action_emoji = emoji
+
+    async def callback(self, interaction):
+        interaction.client.dispatch("event_control", interaction, self.action_emoji)
+
+
+class EventControls(discord.ui.View):
+    """Persistent (no timeout) button row for an event message; with no emojis it holds every action."""
+
+    def __init__(self, emojis=None):
+        super().__init__(timeout=None)
+        for emoji in emojis or list(ACTION_IDS) + list(config.GATHERING_CHANNELS):
+            self.add_item(ControlButton(emoji))
+
+
+async def send_event_message(destination, text, emojis, file=None):
+    """Posts an event message with its controls: one call with buttons, or seeded reactions."""
+    kwargs = {"file": file} if file else {}
+    if config.UI_MODE == "buttons":
+        return await rest.send(destination, text, view=EventControls(emojis), **kwargs)
+
+    message = await rest.send(destination, text, **kwargs)
+    # ✅ Seed reactions in the background, paced by the channel's rate-limit bucket
+    reaction_seeder.seed(message, emojis)
+    return message
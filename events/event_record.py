@@ -0,0 +1,95 @@
+import sys
+import time
+
+
+def countdown_text(item_name, rarity_name, color, amount, creator_name, spawn_time, duration):
+    """Text of a newly posted event message."""
+    rarity_text = f"{rarity_name} " if rarity_name else ""
+    amount_text = f"{amount}x " if amount > 1 else ""  # ✅ Still show amount if > 1
+    text = (
+        f"{color} **{amount_text}{rarity_text}{item_name}** {color}\n"
+        f"👤 **Posted by: {creator_name}**\n"
+        f"⏳ **Next spawn at** <t:{spawn_time}:F>\n"
+        f"⏳ **Countdown:** <t:{spawn_time}:R>\n"
+        f"⏳ **Interval:** {duration // 3600}h"
+    )
+    if duration % 3600 != 0:
+        text += f" {duration % 3600 // 60}m"
+    return text
+
+
+class EventRecord:
+    """Compact, slotted record of one tracked event (stored in `bot.messages_to_delete`).
+
+    Holds only ids, the absolute spawn time, interned display strings and a
+    reference (URL and content hash) to the screenshot, never the Message object or image bytes.
+    """
+
+    __slots__ = (
+        "message_id", "guild_id", "channel_id", "spawn_time", "original_duration", "negative_offset",
+        "item_name", "rarity_name", "color", "amount", "creator_name", "image_url", "image_hash",
+    )
+
+    def __init__(self, message_id, guild_id, channel_id, spawn_time, original_duration, negative_offset,
+                 item_name, rarity_name, color, amount, creator_name, image_url=None, image_hash=None):
+        self.message_id = message_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.spawn_time = int(spawn_time)
+        self.original_duration = int(original_duration)
+        self.negative_offset = int(negative_offset)
+        self.item_name = sys.intern(item_name)
+        self.rarity_name = sys.intern(rarity_name)
+        self.color = sys.intern(color)
+        self.amount = amount
+        self.creator_name = sys.intern(creator_name)
+        self.image_url = image_url
+        self.image_hash = image_hash  # ✅ Attachment cache key of the screenshot (None on a cache miss)
+
+    def __repr__(self):
+        return f"<EventRecord {self.message_id} {self.item_name!r} spawn={self.spawn_time} channel={self.channel_id}>"
+
+    @classmethod
+    def for_message(cls, message, **fields):
+        """Builds a record for a freshly sent event message."""
+        return cls(
+            message_id=message.id,
+            guild_id=message.guild.id if message.guild else None,
+            channel_id=message.channel.id,
+            image_url=message.attachments[0].url if message.attachments else None,
+            **fields,
+        )
+
+    def moved_to(self, message, spawn_time, image_hash=None):
+        """Returns a copy of this record for the message that replaces it (reset/share/claim)."""
+        return EventRecord.for_message(
+            message,
+            spawn_time=spawn_time,
+            image_hash=image_hash if message.attachments else None,
+            original_duration=self.original_duration,
+            negative_offset=self.negative_offset,
+            item_name=self.item_name,
+            rarity_name=self.rarity_name,
+            color=self.color,
+            amount=self.amount,
+            creator_name=self.creator_name,
+        )
+
+    def remaining(self, now=None):
+        """Seconds left until spawn (never negative)."""
+        return max(0, self.spawn_time - int(now if now is not None else time.time()))
+
+    @property
+    def jump_url(self):
+        guild = self.guild_id if self.guild_id else "@me"
+        if self.message_id < 0:  # ✅ Board event (no message of its own): link to the channel
+            return f"https://discord.com/channels/{guild}/{self.channel_id}"
+        return f"https://discord.com/channels/{guild}/{self.channel_id}/{self.message_id}"
+
+    def to_row(self):
+        """Returns the event store row for this record."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(**{name: row[name] for name in cls.__slots__})
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import re
+import discord
+from utils.storage import event_store
+from utils import rest
+
+PERSONAL_CATEGORY = "personal intel"
+OWNER_PATTERN = re.compile(r"<@!?(\d+)>")
+
+# ✅ {(guild ID, user ID): channel ID} for every personal intel channel
+intel_channels = {}
+
+_owners = {}  # ✅ channel ID -> (guild ID, user ID), for gateway channel events
+_categories = {}  # ✅ guild ID -> "personal intel" category ID
+_creating = {}  # ✅ (guild ID, user ID) -> in-flight creation task (single-flight)
+
+def intel_channel_name(member):
+    """Channel name derived from a member's display name (matches channels created before the index existed)."""
+    return member.display_name.lower().replace(" ", "-")
+
+def _is_personal_category(category):
+    return category is not None and category.name.lower() == PERSONAL_CATEGORY
+
+def _index(guild_id, user_id, channel_id):
+    intel_channels[(guild_id, user_id)] = channel_id
+    _owners[channel_id] = (guild_id, user_id)
+
+def _unindex(channel_id):
+    owner = _owners.pop(channel_id, None)
+    if owner and intel_channels.get(owner) == channel_id:
+        del intel_channels[owner]
+    return owner
+
+def _owner_of(channel, members_by_name):
+    """Finds the user a personal channel belongs to: from the topic, else by name."""
+    match = OWNER_PATTERN.search(channel.topic or "")
+    if match:
+        return int(match.group(1))
+    return members_by_name.get(channel.name)
+
+async def warm_intel_index(bot):
+    """Builds the index at startup: persisted entries first, then one pass over each guild's category."""
+    persisted = await event_store.load_intel_channels()
+
+    for guild in bot.guilds:
+        category = next((cat for cat in guild.categories if _is_personal_category(cat)), None)
+        if not category:
+            continue
+        _categories[guild.id] = category.id
+
+        members_by_name = {intel_channel_name(member): member.id for member in guild.members}
+        for (guild_id, user_id), channel_id in persisted.items():
+            if guild_id == guild.id and guild.get_channel(channel_id):
+                _index(guild_id, user_id, channel_id)
+
+        for channel in category.text_channels:
+            if channel.id in _owners:
+                continue
+            user_id = _owner_of(channel, members_by_name)
+            if user_id and (guild.id, user_id) not in intel_channels:
+                _index(guild.id, user_id, channel.id)
+                await event_store.save_intel_channel(guild.id, user_id, channel.id)
+
+    logging.info(f"📥 Indexed {len(intel_channels)} personal intel channels")
+
+async def get_intel_channel(bot, guild, user):
+    """Returns the user's personal intel channel in O(1), creating it at most once per user."""
+    channel = guild.get_channel(intel_channels.get((guild.id, user.id), 0))
+    if channel:
+        return channel
+
+    key = (guild.id, user.id)
+    task = _creating.get(key)
+    if task is None:
+        task = asyncio.create_task(_create_intel_channel(guild, user))
+        _creating[key] = task
+        task.add_done_callback(lambda _: _creating.pop(key, None))
+    return await asyncio.shield(task)  # ✅ Concurrent claims by the same user share one creation
+
+async def _create_intel_channel(guild, user):
+    category = guild.get_channel(_categories.get(guild.id, 0))
+    if not category:
+        return None  # ✅ Guild has no "personal intel" category
+
+    channel = await rest.create_text_channel(
+        guild,
+        name=intel_channel_name(user),
+        category=category,
+        topic=f"Personal intel for <@{user.id}>",  # ✅ Lets the index recover the owner after renames
+    )
+    _index(guild.id, user.id, channel.id)
+    await event_store.save_intel_channel(guild.id, user.id, channel.id)
+    logging.info(f"📥 Created personal intel channel {channel.name} for {user.display_name}")
+    return channel
+
+# ✅ Gateway hooks keeping the index current
+
+async def on_channel_create(channel):
+    if isinstance(channel, discord.CategoryChannel):
+        if _is_personal_category(channel):
+            _categories[channel.guild.id] = channel.id
+        return
+
+    if not isinstance(channel, discord.TextChannel) or not _is_personal_category(channel.category):
+        return
+    if channel.id in _owners:
+        return  # ✅ Already indexed by _create_intel_channel
+
+    members_by_name = {intel_channel_name(member): member.id for member in channel.guild.members}
+    user_id = _owner_of(channel, members_by_name)
+    if user_id and (channel.guild.id, user_id) not in intel_channels:
+        _index(channel.guild.id, user_id, channel.id)
+        await event_store.save_intel_channel(channel.guild.id, user_id, channel.id)
+
+async def on_channel_delete(channel):
+    if isinstance(channel, discord.CategoryChannel):
+        if _categories.get(channel.guild.id) == channel.id:
+            del _categories[channel.guild.id]
+        return
+
+    owner = _unindex(channel.id)
+    if owner:
+        await event_store.delete_intel_channel(*owner)
+
+async def on_channel_update(before, after):
+    if isinstance(after, discord.CategoryChannel):
+        if _is_personal_category(after):
+            _categories[after.guild.id] = after.id
+        elif _categories.get(after.guild.id) == after.id:
+            del _categories[after.guild.id]  # ✅ Category was renamed away
+        return
+
+    if after.id in _owners and not _is_personal_category(getattr(after, "category", None)):
+        await on_channel_delete(after)  # ✅ Moved out of the personal intel category
+    elif after.id not in _owners:
+        await on_channel_create(after)  # ✅ Moved into it (or topic now names an owner)
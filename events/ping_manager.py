@@ -2,9 +2,85 @@ import asyncio
 import time
 import logging
 import discord
+import config
+from utils.scheduler import TimerScheduler
+from utils.storage import event_store
+from utils import rest
 
 # ✅ Dictionary to store user IDs who reacted to the 🔔 for each event
 event_pings = {}
+# ✅ The reverse index, for "my" lookups: {user ID: {event message IDs}}
+user_pings = {}
+
+# ✅ One timer per (event, lead time) in use by its subscribers, fired at spawn time - lead time
+ping_scheduler = TimerScheduler()
+scheduled_leads = {}  # ✅ event message ID -> lead times with a pending timer
+
+# ✅ Per-user reminder settings from !remind: {user ID: (lead times in seconds, via DM)}
+ping_preferences = {}
+MAX_LEAD_TIMES = 5
+
+# ✅ Reminder messages sent per event: {event message ID: {channel ID: [reminder message IDs]}}
+reminder_messages = {}
+# ✅ A coalesced reminder covers several events: {reminder message ID: {event message IDs}}
+reminder_events = {}
+
+MESSAGE_LIMIT = 2000
+
+def lead_times(user_id):
+    """Returns a user's reminder lead times (seconds before spawn), longest first."""
+    return ping_preferences.get(user_id, (config.PING_LEAD_TIMES, False))[0]
+
+def wants_dm(user_id):
+    return ping_preferences.get(user_id, (config.PING_LEAD_TIMES, False))[1]
+
+def cancel_event_pings(message_id):
+    """Cancels every pending reminder timer of an event."""
+    for lead in scheduled_leads.pop(message_id, ()):
+        ping_scheduler.cancel((message_id, lead))
+
+def schedule_event_ping(bot, message_id):
+    """(Re)schedules one reminder timer per distinct lead time among an event's subscribers."""
+    cancel_event_pings(message_id)
+    users = event_pings.get(message_id)
+    record = bot.messages_to_delete.get(message_id)
+    if not users or not record:
+        return
+
+    time_left = record.spawn_time - int(time.time())
+    leads = {lead for user_id in users for lead in lead_times(user_id)}
+    # ✅ Of the lead times that already passed, only the closest one still fires (right away)
+    passed = [lead for lead in leads if lead >= time_left]
+    if passed:
+        leads = {lead for lead in leads if lead < time_left} | {min(passed)}
+
+    # ✅ A passed lead is due now, not at its old deadline (that isn't scheduler lag)
+    now = time.time()
+    for lead in leads:
+        fire_at = max(record.spawn_time - lead, now)
+        ping_scheduler.schedule((message_id, lead), fire_at, lambda lead=lead: send_ping(bot, message_id, lead))
+    scheduled_leads[message_id] = leads
+    logging.debug(f"⏰ Pings for event {message_id} scheduled {sorted(leads, reverse=True)}s before {record.spawn_time}")
+
+async def refresh_preference(user_id):
+    """Reloads a user's !remind settings from the store (they may have been set in another shard process)."""
+    preference = await event_store.get_ping_preference(user_id)
+    if preference:
+        ping_preferences[user_id] = preference
+    else:
+        ping_preferences.pop(user_id, None)
+
+async def set_ping_preference(bot, user_id, leads, dm):
+    """Saves a user's lead times/DM choice (None restores the defaults) and moves their pending reminders."""
+    if leads is None:
+        ping_preferences.pop(user_id, None)
+        await event_store.delete_ping_preference(user_id)
+    else:
+        ping_preferences[user_id] = (tuple(sorted(set(leads), reverse=True)), dm)
+        await event_store.save_ping_preference(user_id, ping_preferences[user_id][0], dm)
+
+    for message_id in user_pings.get(user_id, ()):
+        schedule_event_ping(bot, message_id)
 
 async def track_ping_reaction(bot, payload):
     """Tracks users reacting with 🔔 to be notified when the event is about to expire."""
@@ -14,19 +90,23 @@ async def track_ping_reaction(bot, payload):
         return
 
     guild = bot.get_guild(payload.guild_id)
-    message_id = payload.message_id
     user = guild.get_member(payload.user_id)
 
     if not user or user.bot:
         return  # Ignore bot reactions
 
-    # ✅ Add user to the ping list for this event
-    if message_id not in event_pings:
-        event_pings[message_id] = set()
+    await subscribe(bot, payload.message_id, user)
 
-    event_pings[message_id].add(user.id)
+async def subscribe(bot, message_id, user):
+    """Adds a user to an event's ping list and makes sure their lead times are scheduled."""
+    index_subscribers(message_id, [user.id])
+    await event_store.add_subscription(message_id, user.id)
+    await refresh_preference(user.id)
     logging.info(f"✅ {user.display_name} will be pinged for event {message_id}")
 
+    if not set(lead_times(user.id)) <= scheduled_leads.get(message_id, set()):
+        schedule_event_ping(bot, message_id)
+
 async def remove_ping_reaction(bot, payload):
     """Removes users from the ping list when they remove their 🔔 reaction."""
     logging.debug(f"🔕 Removing ping reaction: {payload.emoji.name} by {payload.user_id}")
@@ -34,73 +114,228 @@ async def remove_ping_reaction(bot, payload):
     if payload.emoji.name != "🔔":
         return  # ✅ Only remove if it's the bell reaction
 
-    message_id = payload.message_id
+    await unsubscribe(bot, payload.message_id, payload.user_id)
+
+async def unsubscribe(bot, message_id, user_id):
+    """Removes a user from an event's ping list. Returns True if they were on it."""
+    if message_id not in event_pings or user_id not in event_pings[message_id]:
+        return False
 
-    # ✅ Remove user from the ping list
-    if message_id in event_pings and payload.user_id in event_pings[message_id]:
-        event_pings[message_id].remove(payload.user_id)
-        logging.info(f"❌ {payload.user_id} removed from pings for event {message_id}")
+    event_pings[message_id].remove(user_id)
+    _unindex_subscriber(message_id, user_id)
+    await event_store.remove_subscription(message_id, user_id)
+    logging.info(f"❌ {user_id} removed from pings for event {message_id}")
 
-        # ✅ If no users remain, remove the event entry
-        if not event_pings[message_id]:
-            del event_pings[message_id]
+    # ✅ If no users remain, remove the event entry
+    if not event_pings[message_id]:
+        del event_pings[message_id]
+        cancel_event_pings(message_id)
+    return True
 
 async def delete_pings_for_event(bot, message_id):
     """Removes all pings associated with a deleted or reset event and deletes reminder messages."""
+    cancel_event_pings(message_id)
     if message_id in event_pings:
-        del event_pings[message_id]  # ✅ Remove from tracking
+        for user_id in event_pings.pop(message_id):  # ✅ Remove from tracking
+            _unindex_subscriber(message_id, user_id)
+        await event_store.clear_subscriptions(message_id)
         logging.info(f"🗑️ All pings removed for event {message_id} (event deleted/reset)")
 
-    # ✅ Now delete actual ping messages
-    for guild in bot.guilds:
-        for channel in guild.text_channels:
+    await delete_reminder_messages(bot, message_id)
+
+def index_subscribers(message_id, user_ids):
+    event_pings.setdefault(message_id, set()).update(user_ids)
+    for user_id in user_ids:
+        user_pings.setdefault(user_id, set()).add(message_id)
+
+def _unindex_subscriber(message_id, user_id):
+    events = user_pings.get(user_id)
+    if events is not None:
+        events.discard(message_id)
+        if not events:
+            del user_pings[user_id]
+
+def index_reminder(event_id, channel_id, reminder_id):
+    reminder_messages.setdefault(event_id, {}).setdefault(channel_id, []).append(reminder_id)
+    reminder_events.setdefault(reminder_id, set()).add(event_id)
+
+async def delete_reminder_messages(bot, message_id):
+    """Deletes the reminder messages sent for an event, straight from the index."""
+    reminders = reminder_messages.pop(message_id, None)
+    if not reminders:
+        return
+    await event_store.clear_reminders(message_id)
+
+    for channel_id, message_ids in reminders.items():
+        # ✅ A coalesced reminder stays until every event it mentions is gone
+        orphaned = []
+        for reminder_id in message_ids:
+            events = reminder_events.get(reminder_id, set())
+            events.discard(message_id)
+            if not events:
+                reminder_events.pop(reminder_id, None)
+                orphaned.append(reminder_id)
+
+        channel = bot.get_channel(channel_id)
+        if channel and orphaned:
+            # ✅ Not awaited: callers often hold the event lock and CLEANUP is the lowest priority
+            rest.fire_and_forget(_delete_reminders(channel, message_id, orphaned))
+
+async def _delete_reminders(channel, message_id, reminder_ids):
+    try:
+        await rest.delete_messages(channel, reminder_ids)
+        logging.info(f"🗑️ Deleted {len(reminder_ids)} reminder message(s) for event {message_id} in {channel.name}")
+    except discord.NotFound:
+        pass  # ✅ Reminder was already deleted
+    except discord.Forbidden:
+        logging.warning(f"⚠️ Missing permissions to delete messages in {channel.name}")
+    except discord.HTTPException as e:
+        logging.error(f"❌ Failed to delete messages: {e}")
+
+async def send_ping(bot, message_id, lead):
+    """Timer callback: queues the reminder for every subscriber of an event who chose this lead time."""
+    scheduled_leads.get(message_id, set()).discard(lead)
+    record = bot.messages_to_delete.get(message_id)
+    users = {user_id for user_id in event_pings.get(message_id, ()) if lead in lead_times(user_id)}
+    if not users or not record:
+        return
+
+    if record.spawn_time - int(time.time()) <= 0:
+        logging.info(f"⏭️ Skipping ping for event {message_id}: it already spawned")
+        return
+
+    # ✅ No double pings if two processes own the event or the timer was rescheduled
+    users = await event_store.claim_pings(message_id, record.spawn_time - lead, users)
+    if not users:
+        logging.info(f"⏭️ Ping for event {message_id} was already sent")
+        return
+
+    logging.info(f"🔔 Queueing ping for event {message_id} ({lead // 60} min lead, {len(users)} users)")
+    channel_users = {user_id for user_id in users if not wants_dm(user_id)}
+    if channel_users:
+        ping_batcher.add(bot, ("channel", record.channel_id), record, channel_users)
+    for user_id in users - channel_users:
+        ping_batcher.add(bot, ("dm", user_id), record, {user_id})
+
+
+class PingBatcher:
+    """Coalesces reminders for the same channel (or the same user's DMs) into one message.
+
+    The first reminder for a destination opens a PING_BATCH_WINDOW-second window;
+    everything that comes due in it is sent together when the window closes.
+    """
+
+    def __init__(self, window=config.PING_BATCH_WINDOW):
+        self.window = window
+        self._pending = {}  # ✅ ("channel", channel ID) / ("dm", user ID) -> {event ID: (record, user IDs)}
+        self._tasks = {}
+        self.stats = {"reminders": 0, "messages": 0}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, bot, target, record, users):
+        batch = self._pending.setdefault(target, {})
+        batch.setdefault(record.message_id, (record, set()))[1].update(users)
+        self.stats["reminders"] += 1
+        if target not in self._tasks:
+            self._tasks[target] = asyncio.get_running_loop().create_task(self._flush_later(bot, target))
+
+    async def _flush_later(self, bot, target):
+        await asyncio.sleep(self.window)
+        self._tasks.pop(target, None)
+        batch = self._pending.pop(target, {})
+        try:
+            if target[0] == "dm":
+                await self._send_dm(bot, target[1], batch)
+            else:
+                await self._send_channel(bot, target[1], batch)
+        except Exception:
+            logging.exception(f"❌ Failed to deliver reminders to {target}")
+
+    @staticmethod
+    def _lines(batch, mentions=True):
+        now = int(time.time())
+        entries = sorted(batch.values(), key=lambda entry: entry[0].spawn_time)
+        if len(entries) == 1:  # ✅ A lone reminder keeps the single-event wording
+            record, users = entries[0]
+            minutes_left = max(1, round((record.spawn_time - now) / 60))
+            mention_text = " ".join(f"<@{user_id}>" for user_id in sorted(users)) + " " if mentions else ""
+            return [(record, f"🔔 **Reminder!** {record.item_name} event ends in **{minutes_left} minutes!** "
+                             f"{mention_text}[Click here]({record.jump_url})")]
+
+        lines = []
+        for record, users in entries:
+            minutes_left = max(1, round((record.spawn_time - now) / 60))
+            mention_text = " " + " ".join(f"<@{user_id}>" for user_id in sorted(users)) if mentions else ""
+            lines.append((record, f"{record.color} **{record.item_name}** in **{minutes_left} min** "
+                                  f"([jump]({record.jump_url})){mention_text}"))
+        return lines
+
+    @staticmethod
+    def _chunks(lines, header):
+        """Packs lines into messages under Discord's length limit: [(records, text)]."""
+        chunks, records, text = [], [], header
+        for record, line in lines:
+            if records and len(text) + len(line) + 1 > MESSAGE_LIMIT:
+                chunks.append((records, text))
+                records, text = [], header
+            records.append(record)
+            text = f"{text}\n{line}" if text else line
+        if records:
+            chunks.append((records, text))
+        return chunks
+
+    async def _send_channel(self, bot, channel_id, batch):
+        channel = bot.get_channel(channel_id)
+        if not channel or not batch:
+            return
+        lines = self._lines(batch)
+        header = "" if len(lines) == 1 else f"🔔 **Reminders!** {len(lines)} events spawning soon:"
+        for records, text in self._chunks(lines, header):
             try:
-                async for msg in channel.history(limit=50):  # ✅ Check last 50 messages
-                    if msg.author == bot.user and f"Reminder!" in msg.content and f"{message_id}" in msg.content:
-                        await msg.delete()
-                        logging.info(f"🗑️ Deleted reminder message for event {message_id} in {channel.name}")
+                reminder = await rest.send(channel, text[:MESSAGE_LIMIT], priority=rest.PING)
             except discord.Forbidden:
-                logging.warning(f"⚠️ Missing permissions to delete messages in {channel.name}")
+                logging.error(f"🚫 Bot lacks permission to send messages in {channel.name}!")
+                return
             except discord.HTTPException as e:
-                logging.error(f"❌ Failed to delete messages: {e}")
+                logging.error(f"❌ Failed to send ping: {e}")
+                continue
+            self.stats["messages"] += 1
+            for record in records:
+                if record.message_id in bot.messages_to_delete:  # ✅ Event may have been deleted meanwhile
+                    index_reminder(record.message_id, channel.id, reminder.id)
+                    await event_store.add_reminder(record.message_id, channel.id, reminder.id)
+
+    async def _send_dm(self, bot, user_id, batch):
+        if not batch:
+            return
+        any_record = next(iter(batch.values()))[0]
+        guild = bot.get_guild(any_record.guild_id) if any_record.guild_id else None
+        member = guild.get_member(user_id) if guild else None
+        lines = self._lines(batch, mentions=False)
+        header = "" if len(lines) == 1 else f"🔔 **Reminders!** {len(lines)} events spawning soon:"
+        chunks = self._chunks(lines, header)
+        delivered = 0
+        try:
+            if member is None:
+                raise LookupError("member not found")
+            for _, text in chunks:
+                await rest.send(member, text[:MESSAGE_LIMIT], priority=rest.PING)
+                self.stats["messages"] += 1
+                delivered += 1
+        except (LookupError, discord.Forbidden) as e:
+            # ✅ DMs closed (or member gone): only the chunks that didn't arrive fall back to the events' channels
+            logging.warning(f"⚠️ Could not DM reminders to {user_id} ({e}), pinging in channel instead")
+            for records, _ in chunks[delivered:]:
+                for record in records:
+                    self.add(bot, ("channel", record.channel_id), record, batch[record.message_id][1])
+        except discord.HTTPException as e:
+            logging.error(f"❌ Failed to DM ping to {user_id}: {e}")
 
+# ✅ Shared reminder batcher
+ping_batcher = PingBatcher()
 
 async def schedule_pings(bot):
-    """Background task that checks for events reaching 15 minutes remaining and pings users."""
-    while True:
-        current_time = int(time.time())
-        to_remove = []
-
-        for message_id, users in list(event_pings.items()):  # ✅ Use list() to prevent runtime issues
-            if message_id in bot.messages_to_delete:
-                event_data = bot.messages_to_delete[message_id]
-                message, original_duration, stored_remaining_time, negative_adjustment, item_name, rarity, color, amount, channel_id, creator_name, image_url = event_data
-                
-                event_creation_time = int(message.created_at.timestamp())  # ✅ Get event creation time
-                actual_time_left = max(0, (event_creation_time + stored_remaining_time) - current_time)  # ✅ Dynamically calculate remaining time
-
-                # ✅ Debugging logs
-                logging.debug(f"🔎 Checking pings: {message_id} | Time Left: {actual_time_left}s")
-
-                if 900 <= actual_time_left < 960:  # ✅ Ping when 15 minutes left
-                    logging.info(f"🔔 Sending ping for event {message_id}")
-
-                    channel = bot.get_channel(channel_id)
-                    if channel:
-                        mentions = " ".join([f"<@{user_id}>" for user_id in users])
-                        event_link = f"[Click here]({message.jump_url})"  # ✅ Include event link in the ping
-
-                        try:
-                            await channel.send(f"🔔 **Reminder!** {item_name} event ends in **15 minutes!** {mentions} {event_link}")
-                        except discord.Forbidden:
-                            logging.error(f"🚫 Bot lacks permission to send messages in {channel.name}!")
-                        except discord.HTTPException as e:
-                            logging.error(f"❌ Failed to send ping: {e}")
-
-                    to_remove.append(message_id)  # ✅ Remove event after ping is sent
-
-        # ✅ Remove processed events
-        for msg_id in to_remove:
-            event_pings.pop(msg_id, None)
-
-        await asyncio.sleep(30)  # ✅ Check every 30 seconds
+    """Background task that sleeps until the next reminder deadline and pings users."""
+    await ping_scheduler.run()
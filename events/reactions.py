@@ -2,7 +2,26 @@ import discord
 import config
 import time
 import logging
-from events.ping_manager import track_ping_reaction, remove_ping_reaction, delete_pings_for_event  # ✅ Import ping management
+from events.ping_manager import track_ping_reaction, remove_ping_reaction  # ✅ Import ping management
+from events.ping_manager import delete_reminder_messages, schedule_event_ping, subscribe, unsubscribe, lead_times
+from events.controls import control_emojis, send_event_message
+from events.tracking import track_event, update_event, forget_event, event_locks, is_retired
+from utils.message_cache import message_cache
+from utils.attachment_cache import attachment_cache
+from utils.bosses import zone_timers
+from commands.bosses import reset_zone
+from events.intel_channels import get_intel_channel
+from utils import rest
+from utils.metrics import REACTIONS_DROPPED
+from utils.spawn_history import spawn_history, RESET, SHARE, CLAIM
+
+HISTORY_ACTIONS = {"✅": RESET, "📥": CLAIM}
+
+def reaction_action(emoji):
+    """Names the action a reaction triggers (used to label metrics)."""
+    if emoji in config.GATHERING_CHANNELS:
+        return "share"
+    return {"✅": "reset", "🗑️": "delete", "🔔": "ping", "📥": "claim"}.get(emoji, "other")
 
 async def handle_reaction(bot, payload):
     logging.debug("🚨 DEBUG: handle_reaction() function was triggered!")  
@@ -17,42 +36,95 @@ async def handle_reaction(bot, payload):
     if not user or user.bot:
         return  
 
-    try:
-        message = await channel.fetch_message(payload.message_id)
-    except discord.NotFound:
-        return  
-
     reaction_emoji = str(payload.emoji)
+    if reaction_action(reaction_emoji) == "other":
+        return  # ✅ Not a control (e.g. 👍 on chat): no fetch, no lock
 
-    # ✅ Handle Bell reaction (Ping system)
+    # ✅ Handle Bell reaction (Ping system) straight from the payload, the message isn't needed
     if reaction_emoji == "🔔":
         if payload.event_type == "REACTION_REMOVE":
             await remove_ping_reaction(bot, payload)
-            logging.info(f"❌ {user.display_name} removed from pings for event {message.id}")
-        else:
+            logging.info(f"❌ {user.display_name} removed from pings for event {payload.message_id}")
+        elif payload.message_id in bot.messages_to_delete:
             await track_ping_reaction(bot, payload)
+        return
+
+    # ✅ Duplicate reactions on an event that was already moved or deleted are dropped without a fetch
+    if is_retired(payload.message_id):
+        REACTIONS_DROPPED.inc(action=reaction_action(reaction_emoji))
+        return
+
+    # ✅ Only tracked events have actions, except 🗑️ which also clears the bot's own untracked messages
+    if payload.message_id not in bot.messages_to_delete and reaction_emoji != "🗑️":
+        return
+
+    # ✅ One reaction per event at a time: the first reset/share/claim wins, later ones see it retired
+    async with event_locks.hold(payload.message_id):
+        if is_retired(payload.message_id):
+            REACTIONS_DROPPED.inc(action=reaction_action(reaction_emoji))
+            return
+        await apply_reaction(bot, payload, guild, channel, user)
+
+async def apply_reaction(bot, payload, guild, channel, user):
+    """Runs a reaction's action on its event (caller holds the event's lock)."""
+    try:
+        message = await message_cache.fetch(channel, payload.message_id)
+    except discord.NotFound:
         return  
 
+    await apply_action(bot, message, str(payload.emoji), guild, channel, user)
+
+async def handle_interaction(bot, interaction, emoji):
+    """Button clicks: the same actions as reactions, but the interaction carries the message and member."""
+    message, user = interaction.message, interaction.user
+
+    # ✅ Interaction responses bypass the REST queue: they must land within 3 seconds and use their own bucket
+    if emoji == "🔔":
+        if await unsubscribe(bot, message.id, user.id):
+            text = "🔕 You won't be pinged for this event anymore."
+        else:
+            await subscribe(bot, message.id, user)
+            text = f"🔔 You'll be pinged {', '.join(str(lead // 60) for lead in lead_times(user.id))} minutes before it spawns."
+        await interaction.response.send_message(text, ephemeral=True)
+        return
+
+    await interaction.response.defer()  # ✅ Acknowledge the click; the action edits or reposts the message itself
+    if is_retired(message.id):
+        REACTIONS_DROPPED.inc(action=reaction_action(emoji))
+        return
+
+    async with event_locks.hold(message.id):
+        if is_retired(message.id):
+            REACTIONS_DROPPED.inc(action=reaction_action(emoji))
+            return
+        await apply_action(bot, message, emoji, interaction.guild, interaction.channel, user, from_reaction=False)
+
+async def apply_action(bot, message, reaction_emoji, guild, channel, user, from_reaction=True):
+    """Runs a delete/reset/share/claim on an event message (caller holds the event's lock)."""
     # ✅ Auto-delete event messages when clicking 🗑️
     if reaction_emoji == "🗑️" and message.author == bot.user:
-        await delete_pings_for_event(bot, message.id)  # ✅ Remove all associated pings
-        logging.info(f"🗑️ Pings cleared for event {message.id} due to delete reaction.")
-        await message.delete()
-        bot.messages_to_delete.pop(message.id, None)
+        await forget_event(bot, message.id)  # ✅ Also clears its pings and reminders
+        rest.fire_and_forget(rest.delete(message))  # ✅ Not awaited: CLEANUP must not hold the event lock
         return  
 
     # ✅ Ensure the event exists in tracking
     if message.id not in bot.messages_to_delete:
         return
 
-    message_data = bot.messages_to_delete[message.id]
-    message, original_duration, remaining_duration, negative_adjustment, item_name, rarity_name, color, amount, channel_id, creator_name, image_url = message_data
+    # ✅ Zone boss timers only support reset (edited in place)
+    if message.id in zone_timers:
+        if reaction_emoji == "✅":
+            await reset_zone(bot, message, user, rearm_reaction=from_reaction)
+        return
+
+    record = bot.messages_to_delete[message.id]
+    original_duration = record.original_duration
+    item_name, rarity_name, color, amount = record.item_name, record.rarity_name, record.color, record.amount
 
     current_time = int(time.time())
 
-    # ✅ Calculate the actual remaining time based on when the event was created
-    elapsed_time = current_time - int(message.created_at.timestamp())
-    actual_remaining_time = max(0, (int(message.created_at.timestamp()) + remaining_duration) - current_time)
+    # ✅ Remaining time comes straight from the absolute spawn time
+    actual_remaining_time = record.remaining(current_time)
 
     # ✅ Correct new spawn time calculation
     if reaction_emoji == "✅":
@@ -71,71 +143,72 @@ async def handle_reaction(bot, payload):
             f"⏳ **Interval: {original_duration//60}m**"
         )
 
-    reset_reactions = []  
+    # ✅ Edit-in-place reset: new text and deadline, reactions and attachment stay (2 calls instead of ~10)
+    if reaction_emoji == "✅" and config.RESET_MODE == "edit":
+        await reset_in_place(bot, message, record, user, new_spawn_time, generate_event_text(user.display_name, "Reset"),
+                             rearm_reaction=from_reaction)
+        return
 
     # ✅ Reset Event (Restore full event duration)
     if reaction_emoji == "✅":
-        await delete_pings_for_event(bot, message.id)
-        logging.info(f"🗑️ Pings cleared for event {message.id} due to reset reaction.")
-
         event_text = generate_event_text(user.display_name, "Reset")
         channel = channel  
 
-        if channel.name in config.GATHERING_CHANNELS.values():
-            reset_reactions = ["📥", "🔔"]
-        else:
-            reset_reactions = list(config.GATHERING_CHANNELS.keys()) + ["🔔"]
-
     # ✅ Share Event (Keep Correct Remaining Time)
     elif reaction_emoji in config.GATHERING_CHANNELS:
         new_channel_name = config.GATHERING_CHANNELS[reaction_emoji]
         target_channel = discord.utils.get(guild.channels, name=new_channel_name)
 
-        if target_channel:
-            event_text = generate_event_text(user.display_name, "Shared")
-            channel = target_channel  
-            reset_reactions = ["📥"]
+        if not target_channel:
+            return
+        event_text = generate_event_text(user.display_name, "Shared")
+        channel = target_channel  
 
     # ✅ Claim Event (Keep Correct Remaining Time)
     elif reaction_emoji == "📥":
-        user_channel_name = user.display_name.lower().replace(" ", "-")
-        personal_category = next((cat for cat in guild.categories if cat.name.lower() == "personal intel"), None)
-
-        if not personal_category:
-            return
-
-        user_channel = discord.utils.get(guild.text_channels, name=user_channel_name, category=personal_category)
+        user_channel = await get_intel_channel(bot, guild, user)  # ✅ Indexed lookup, created at most once
 
         if not user_channel:
-            user_channel = await guild.create_text_channel(name=user_channel_name, category=personal_category)
+            return
 
         event_text = generate_event_text(user.display_name, "Claimed")
         channel = user_channel
-        reset_reactions = list(config.GATHERING_CHANNELS.keys())
+
+    else:
+        return
+
+    # ✅ Every reset/share/claim is an observation for the respawn-interval analysis
+    spawn_history.record(HISTORY_ACTIONS.get(reaction_emoji, SHARE), record, current_time)
 
     # ✅ Send the updated event message
-    file = None
+    file, file_hash = None, None
     if message.attachments:
-        file = await message.attachments[0].to_file()
-
-    if file:
-        new_message = await channel.send(event_text, file=file)
-    else:
-        new_message = await channel.send(event_text)
-
-    # ✅ Add reactions
-    await new_message.add_reaction("✅")
-    await new_message.add_reaction("🗑️")
-    await new_message.add_reaction("🔔")
-    
-    for emoji in reset_reactions:
-        await new_message.add_reaction(emoji)
-
-    # ✅ Store event with correct remaining time
-    bot.messages_to_delete[new_message.id] = (
-        new_message, original_duration, actual_remaining_time, negative_adjustment,
-        item_name.capitalize(), rarity_name, color, amount, channel.id, creator_name,
-        file
-    )
-
-    await message.delete()  # ✅ Remove old message
+        # ✅ No download on a cache hit, even for events posted before a restart
+        file, file_hash = await attachment_cache.get_file(message.attachments[0], record.image_hash)
+
+    # ✅ Controls match the destination: claim in gathering channels, sharing everywhere else
+    new_message = await send_event_message(channel, event_text, control_emojis(channel), file=file)
+
+    # ✅ Store event with its new absolute spawn time
+    await track_event(bot, record.moved_to(new_message, new_spawn_time, file_hash), new_message)
+
+    await forget_event(bot, message.id)  # ✅ Retires the old ID before anything else can fail
+    rest.fire_and_forget(rest.delete(message))  # ✅ Remove old message without holding the event lock
+
+async def reset_in_place(bot, message, record, user, new_spawn_time, event_text, rearm_reaction=True):
+    """Resets an event by editing its message and removing only the user's ✅ (buttons need no re-arming)."""
+    await rest.edit(message, content=event_text)  # ✅ Raises before any state changes if the edit fails
+    spawn_history.record(RESET, record)  # ✅ Logged with the pre-reset spawn time
+    record.spawn_time = new_spawn_time
+    if rearm_reaction:
+        try:
+            await rest.remove_reaction(message, "✅", user)  # ✅ Re-arm the reset button
+        except (discord.Forbidden, discord.NotFound):
+            pass
+
+    await update_event(bot, record)
+
+    # ✅ Subscribers keep their 🔔, so move their reminder to the new deadline
+    await delete_reminder_messages(bot, message.id)
+    schedule_event_ping(bot, message.id)
+    logging.info(f"🔄 {user.display_name} reset event {message.id} in place")
@@ -0,0 +1,91 @@
+import bisect
+import heapq
+import itertools
+
+
+class SpawnIndex:
+    """Tracked events sorted by absolute spawn time, per guild, per channel and per (guild, item).
+
+    Each list holds (spawn_time, message_id) tuples; the first upcoming entry is
+    found by bisect, so the next N spawns cost O(log n + N).
+    """
+
+    def __init__(self):
+        self._entries = {}  # ✅ message ID -> (spawn_time, keys of the lists it is in)
+        self._lists = {}  # ✅ ("guild", id) / ("channel", id) / ("item", guild id, name) -> sorted list
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _keys(record):
+        return (("guild", record.guild_id), ("channel", record.channel_id),
+                ("item", record.guild_id, record.item_name.lower()))
+
+    def add(self, record):
+        """Indexes (or re-indexes) a record at its current spawn time."""
+        self.remove(record.message_id)
+        keys = self._keys(record)
+        entry = (record.spawn_time, record.message_id)
+        for key in keys:
+            bisect.insort(self._lists.setdefault(key, []), entry)
+        self._entries[record.message_id] = (record.spawn_time, keys)
+
+    def remove(self, message_id):
+        indexed = self._entries.pop(message_id, None)
+        if indexed is None:
+            return
+        spawn_time, keys = indexed
+        entry = (spawn_time, message_id)
+        for key in keys:
+            entries = self._lists[key]
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+            if not entries:
+                del self._lists[key]
+
+    def rebuild(self, records):
+        """Replaces the whole index in one pass (used after restoring from storage)."""
+        self._entries.clear()
+        self._lists.clear()
+        for record in records:
+            keys = self._keys(record)
+            for key in keys:
+                self._lists.setdefault(key, []).append((record.spawn_time, record.message_id))
+            self._entries[record.message_id] = (record.spawn_time, keys)
+        for entries in self._lists.values():
+            entries.sort()
+
+    def _upcoming(self, key, now):
+        entries = self._lists.get(key, [])
+        start = bisect.bisect_left(entries, (now,))
+        return itertools.islice(entries, start, None)
+
+    def next_in_guild(self, guild_id, now, limit):
+        return [message_id for _, message_id in itertools.islice(self._upcoming(("guild", guild_id), now), limit)]
+
+    def next_in_channel(self, channel_id, now, limit):
+        return [message_id for _, message_id in itertools.islice(self._upcoming(("channel", channel_id), now), limit)]
+
+    def next_for_item(self, guild_id, item_name, now, limit):
+        key = ("item", guild_id, item_name.lower())
+        return [message_id for _, message_id in itertools.islice(self._upcoming(key, now), limit)]
+
+    def next_among(self, channel_ids, message_ids, now, limit):
+        """Merges upcoming spawns of some channels and some individual events (e.g. a user's own)."""
+        singles = sorted((self._entries[mid][0], mid) for mid in message_ids if mid in self._entries)
+        singles = singles[bisect.bisect_left(singles, (now,)):]
+        sources = [self._upcoming(("channel", channel_id), now) for channel_id in channel_ids] + [iter(singles)]
+        seen, result = set(), []
+        for _, message_id in heapq.merge(*sources):
+            if message_id not in seen:
+                seen.add(message_id)
+                result.append(message_id)
+                if len(result) == limit:
+                    break
+        return result
+
+
+# ✅ Shared index, kept current by events.tracking
+spawn_index = SpawnIndex()
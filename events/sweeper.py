@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import time
+import discord
+import config
+from events.tracking import forget_event, event_locks
+from utils.bosses import zone_timers
+from utils.sharding import owns_guild
+from utils.storage import event_store
+from utils.metrics import EVENTS_SWEPT
+from utils import rest
+
+def _expired(bot, row, cutoff):
+    """Re-checks a stored row against memory: a reset may have moved it since the query."""
+    record = bot.messages_to_delete.get(row["message_id"])
+    if record and record.spawn_time > cutoff:
+        return False
+    timers = zone_timers.get(row["message_id"])
+    if timers and max(spawn_time for _, spawn_time in timers.values()) > cutoff:
+        return False  # ✅ Some boss in the zone hasn't spawned yet
+    return True
+
+async def sweep_expired(bot, now=None):
+    """Evicts events that spawned more than EXPIRY_GRACE seconds ago. Returns how many were swept."""
+    cutoff = int(now if now is not None else time.time()) - config.EXPIRY_GRACE
+    rows = await event_store.events_spawning_before(cutoff)  # ✅ Served by the spawn_time index
+
+    swept = {}  # ✅ channel ID -> [rows]
+    for row in rows:
+        if not owns_guild(row["guild_id"]):
+            continue  # ✅ Another shard process sweeps its own guilds
+        async with event_locks.hold(row["message_id"]):  # ✅ Don't race a reset on the same event
+            if not _expired(bot, row, cutoff):
+                continue
+            await forget_event(bot, row["message_id"])  # ✅ Also drops its pings and reminders
+        swept.setdefault(row["channel_id"], []).append(row)
+
+    count = sum(len(channel_rows) for channel_rows in swept.values())
+    if not count:
+        return 0
+
+    for channel_id, channel_rows in swept.items():
+        channel = bot.get_channel(channel_id)
+        channel_rows = [row for row in channel_rows if row["message_id"] > 0]  # ✅ Board events have no message of their own
+        if channel and channel_rows:
+            await _clean_up_messages(channel, channel_rows)
+
+    EVENTS_SWEPT.inc(count)
+    logging.info(f"🧹 Swept {count} expired events from {len(swept)} channels")
+    return count
+
+async def _clean_up_messages(channel, rows):
+    """Applies EXPIRY_ACTION to the swept events' messages."""
+    try:
+        if config.EXPIRY_ACTION == "delete":
+            await rest.delete_messages(channel, [row["message_id"] for row in rows])
+        elif config.EXPIRY_ACTION == "mark":
+            for row in rows:
+                await rest.edit(
+                    channel.get_partial_message(row["message_id"]),
+                    content=f"💤 ~~{row['color']} **{row['item_name']}**~~ spawned <t:{row['spawn_time']}:R> (no longer tracked)",
+                )
+    except discord.NotFound:
+        pass  # ✅ Someone deleted them already
+    except discord.HTTPException as e:
+        logging.warning(f"⚠️ Failed to clean up expired messages in {channel.name}: {e}")
+
+async def run_sweeper(bot):
+    """Background task: sweeps expired events every SWEEP_INTERVAL seconds."""
+    while True:
+        try:
+            await sweep_expired(bot)
+        except Exception:
+            logging.exception("❌ Expiry sweep failed")
+        await asyncio.sleep(config.SWEEP_INTERVAL)
@@ -0,0 +1,117 @@
+import logging
+from collections import OrderedDict
+import discord
+from events.event_record import EventRecord, countdown_text
+from events.controls import control_emojis, send_event_message
+from events.ping_manager import event_pings, ping_preferences, index_reminder, index_subscribers, schedule_event_ping, delete_pings_for_event
+from utils.storage import event_store
+from utils.message_cache import message_cache
+from utils.bosses import zone_timers
+from events.board import board_channels, mark_board_dirty
+from utils.sharding import owns_guild
+from utils.locks import KeyedLock
+from events.spawn_index import spawn_index
+
+# ✅ Serializes reset/share/claim/delete per event; unrelated events run in parallel
+event_locks = KeyedLock()
+
+# ✅ Message IDs of events that were moved or deleted, so late duplicate reactions are dropped cheaply
+retired_events = OrderedDict()
+MAX_RETIRED = 10000
+
+def is_retired(message_id):
+    return message_id in retired_events
+
+def _retire(message_id):
+    retired_events[message_id] = True
+    retired_events.move_to_end(message_id)
+    while len(retired_events) > MAX_RETIRED:
+        retired_events.popitem(last=False)
+
+async def track_event(bot, record, message=None):
+    """Registers a new event record in memory and persists it."""
+    bot.messages_to_delete[record.message_id] = record
+    spawn_index.add(record)
+    if isinstance(message, discord.Message):
+        message_cache.put(message)  # ✅ Reactions on this message won't need a fetch
+    await event_store.save_event(record.to_row())
+    mark_board_dirty(bot, record.channel_id)
+
+async def update_event(bot, record):
+    """Persists changes made to a tracked record (e.g. a new spawn time)."""
+    spawn_index.add(record)  # ✅ Moves it to its new spot
+    await event_store.save_event(record.to_row())
+    mark_board_dirty(bot, record.channel_id)
+
+async def forget_event(bot, message_id):
+    """Drops an event, its ping timers/subscriptions and its reminders from memory and from the store."""
+    _retire(message_id)
+    record = bot.messages_to_delete.pop(message_id, None)
+    await delete_pings_for_event(bot, message_id)  # ✅ A moved event must not leave timers behind under its old ID
+    spawn_index.remove(message_id)
+    zone_timers.pop(message_id, None)
+    message_cache.discard(message_id)
+    await event_store.delete_event(message_id)
+    if record:
+        mark_board_dirty(bot, record.channel_id)
+
+async def post_board_events(bot, channel):
+    """Reposts a channel's board events as normal event messages once its board is gone."""
+    records = [record for record in bot.messages_to_delete.values() if record.channel_id == channel.id and record.message_id < 0]
+    for record in sorted(records, key=lambda record: record.spawn_time):
+        async with event_locks.hold(record.message_id):  # ✅ Don't race the sweeper on the same event
+            if record.message_id not in bot.messages_to_delete:
+                continue
+            text = countdown_text(record.item_name, record.rarity_name, record.color, record.amount,
+                                  record.creator_name, record.spawn_time, record.original_duration)
+            message = await send_event_message(channel, text, control_emojis(channel))
+            await track_event(bot, record.moved_to(message, record.spawn_time), message)
+            await forget_event(bot, record.message_id)
+    if records:
+        logging.info(f"📋 Reposted {len(records)} board events in {channel.name} as messages")
+
+async def restore_events(bot):
+    """Rehydrates events, zone timers, boards, pings, reminder preferences and reminder messages from the store in one bulk load."""
+    state = await event_store.load_all()
+    rows = [row for row in state["events"] if owns_guild(row["guild_id"])]  # ✅ Other shards' events stay untouched
+    pings = state["pings"]
+    restored = 0
+
+    skipped = 0
+    for row in rows:
+        if not bot.get_channel(row["channel_id"]):
+            guild = bot.get_guild(row["guild_id"]) if row["guild_id"] else None
+            if guild is not None and not getattr(guild, "unavailable", False):
+                await event_store.delete_event(row["message_id"])  # ✅ Guild is up and the channel is really gone
+            else:
+                skipped += 1  # ✅ Guild unavailable (outage) or not visible yet: keep the row for the next restore
+            continue
+
+        bot.messages_to_delete[row["message_id"]] = EventRecord.from_row(row)
+        if row["message_id"] in state["boss_timers"]:
+            zone_timers[row["message_id"]] = state["boss_timers"][row["message_id"]]
+        restored += 1
+
+    spawn_index.rebuild(bot.messages_to_delete.values())
+
+    for event_id, reminders in state["reminders"].items():
+        if event_id in bot.messages_to_delete:
+            for channel_id, reminder_ids in reminders.items():
+                for reminder_id in reminder_ids:
+                    index_reminder(event_id, channel_id, reminder_id)
+
+    ping_preferences.update(state["ping_preferences"])
+
+    for message_id, users in pings.items():
+        if message_id in bot.messages_to_delete:
+            index_subscribers(message_id, users)
+            schedule_event_ping(bot, message_id)
+
+    for channel_id, board_id in state["boards"].items():
+        if bot.get_channel(channel_id):
+            board_channels[channel_id] = board_id
+            mark_board_dirty(bot, channel_id)  # ✅ Catch up on anything that changed while offline
+
+    logging.info(f"🗄️ Restored {restored} events and {len(event_pings)} ping subscriptions from storage")
+    if skipped:
+        logging.warning(f"⚠️ Kept {skipped} stored events whose guild is unavailable; they load on the next restore")
@@ -0,0 +1,73 @@
+"""Runs the bot as several shard processes on one host, sharing countdown.db and items.json.
+
+    SHARD_COUNT=8 python launcher.py --processes 4
+
+Shards are dealt round-robin to the processes (process 0 gets 0 and 4, ...).
+Each process gets its own log file and, if metrics are enabled, its own metrics
+port (METRICS_PORT + process index). Crashed processes are restarted.
+"""
+import argparse
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+import config
+
+RESTART_DELAY = 5  # ✅ Seconds before restarting a crashed shard process
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [launcher] %(message)s")
+
+
+def process_env(index, processes, shard_count):
+    env = dict(os.environ)
+    env["SHARD_COUNT"] = str(shard_count)
+    env["SHARD_IDS"] = ",".join(str(shard) for shard in range(index, shard_count, processes))
+    env["LOG_FILE"] = f"{os.path.splitext(config.LOG_FILE)[0]}.{index}.log"
+    if config.METRICS_PORT:
+        env["METRICS_PORT"] = str(config.METRICS_PORT + index)
+    return env
+
+
+def start(index, processes, shard_count):
+    env = process_env(index, processes, shard_count)
+    logging.info(f"🧩 Starting process {index} with shards {env['SHARD_IDS']}")
+    return subprocess.Popen([sys.executable, "bot.py"], env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the bot as several shard processes.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shards", type=int, default=config.SHARD_COUNT, help="total shard count (default: SHARD_COUNT)")
+    args = parser.parse_args()
+
+    shard_count = args.shards or args.processes
+    processes = min(args.processes, shard_count)
+    children = {index: start(index, processes, shard_count) for index in range(processes)}
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for child in children.values():
+            child.terminate()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while not stopping:
+        time.sleep(1)
+        for index, child in list(children.items()):
+            if child.poll() is not None and not stopping:
+                logging.warning(f"⚠️ Process {index} exited with code {child.returncode}, restarting in {RESTART_DELAY}s")
+                time.sleep(RESTART_DELAY)
+                children[index] = start(index, processes, shard_count)
+
+    for child in children.values():
+        child.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import io
+import logging
+import os
+from collections import OrderedDict
+import discord
+import config
+from utils.http import get_session
+
+
+class AttachmentCache:
+    """Disk-backed, byte-budgeted LRU of attachment bytes keyed by SHA-256 of the content.
+
+    Discord gives every re-uploaded copy a new attachment ID, so events store the
+    content hash of their screenshot (EventRecord.image_hash); resetting or sharing
+    it again is then served from disk without downloading it, across restarts too.
+    """
+
+    def __init__(self, directory=config.ATTACHMENT_CACHE_DIR, max_bytes=config.ATTACHMENT_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # ✅ content hash -> size, least recently used first
+        self._bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "bytes_downloaded": 0}
+        self._load_index()
+
+    def _load_index(self):
+        """Indexes files left on disk by a previous run, oldest first."""
+        os.makedirs(self.directory, exist_ok=True)
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if len(name) == 64 and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._bytes += size
+
+    def _path(self, content_hash):
+        return os.path.join(self.directory, content_hash)
+
+    @property
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    async def get_file(self, attachment, content_hash=None):
+        """Returns `(discord.File, content_hash)` for an attachment, downloading only when its hash isn't cached."""
+        loop = asyncio.get_running_loop()
+
+        if content_hash in self._entries:
+            try:
+                data = await loop.run_in_executor(None, self._read, content_hash)
+                self._entries.move_to_end(content_hash)
+                self.stats["hits"] += 1
+                self.stats["bytes_saved"] += len(data)
+                return discord.File(io.BytesIO(data), filename=attachment.filename), content_hash
+            except OSError:
+                self._forget(content_hash)  # ✅ File vanished from disk, fall through to a download
+
+        self.stats["misses"] += 1
+        data = await self._download(attachment)
+        if data is None:
+            return await attachment.to_file(), None  # ✅ Let discord.py try on its own
+
+        content_hash = hashlib.sha256(data).hexdigest()
+        self.stats["bytes_downloaded"] += len(data)
+        if content_hash not in self._entries:
+            try:
+                await loop.run_in_executor(None, self._write, content_hash, data)
+            except OSError as e:
+                logging.warning(f"⚠️ Could not cache attachment on disk: {e}")
+                return discord.File(io.BytesIO(data), filename=attachment.filename), None
+            if content_hash in self._entries:
+                self._entries.move_to_end(content_hash)  # ✅ A concurrent miss on the same content stored it first
+                return discord.File(io.BytesIO(data), filename=attachment.filename), content_hash
+            self._entries[content_hash] = len(data)
+            self._bytes += len(data)
+            victims = self._evict()
+            if victims:
+                await loop.run_in_executor(None, self._remove_files, victims)
+        return discord.File(io.BytesIO(data), filename=attachment.filename), content_hash
+
+    async def _download(self, attachment):
+        try:
+            async with get_session().get(attachment.url) as resp:
+                if resp.status == 200:
+                    return await resp.read()
+                logging.warning(f"⚠️ Attachment download failed with HTTP {resp.status}: {attachment.url}")
+        except Exception as e:
+            logging.warning(f"⚠️ Attachment download failed: {e}")
+        return None
+
+    def _read(self, content_hash):
+        with open(self._path(content_hash), "rb") as file:
+            return file.read()
+
+    def _write(self, content_hash, data):
+        tmp_path = self._path(content_hash) + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, self._path(content_hash))
+
+    def _forget(self, content_hash):
+        self._bytes -= self._entries.pop(content_hash, 0)
+
+    def _evict(self):
+        """Drops least recently used entries until the cache fits its byte budget; returns their hashes."""
+        victims = []
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            content_hash, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            victims.append(content_hash)
+        return victims
+
+    def _remove_files(self, content_hashes):
+        for content_hash in content_hashes:
+            try:
+                os.remove(self._path(content_hash))
+            except FileNotFoundError:
+                pass
+
+
+# ✅ Shared cache instance
+attachment_cache = AttachmentCache()
@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+
+BOSSES_FILE = "bosses.json"
+
+# ✅ Live zone timers: {zone message ID: {boss name: (respawn seconds, absolute spawn time)}}
+zone_timers = {}
+
+
+class BossCatalog:
+    """Zone -> boss -> respawn seconds, loaded once from bosses.json and indexed for lookups."""
+
+    def __init__(self, path=BOSSES_FILE):
+        self.path = path
+        self.zones = {}  # ✅ zone (lowercase) -> {boss display name: respawn seconds}
+        self.boss_index = {}  # ✅ boss name (lowercase) -> (zone, boss display name)
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            logging.warning(f"⚠️ {self.path} not found, boss tracking disabled.")
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            logging.warning(f"⚠️ Failed to decode {self.path}!")
+            return
+
+        for zone, bosses in data.items():
+            zone_key = zone.lower().strip()
+            self.zones[zone_key] = {name.strip(): int(seconds) for name, seconds in bosses.items()}
+            for name in self.zones[zone_key]:
+                self.boss_index[name.lower()] = (zone_key, name)
+        logging.info(f"✅ Loaded {len(self.boss_index)} bosses in {len(self.zones)} zones from {self.path}")
+
+    def find_zone(self, text):
+        """Returns the zone matching `text` exactly or by unique prefix, or None."""
+        text = text.lower().strip()
+        if text in self.zones:
+            return text
+        matches = [zone for zone in self.zones if zone.startswith(text)]
+        return matches[0] if len(matches) == 1 else None
+
+    def find_boss(self, text):
+        """Returns (zone, boss display name) for a boss named `text` exactly or by unique prefix, or None."""
+        text = text.lower().strip()
+        if text in self.boss_index:
+            return self.boss_index[text]
+        matches = [key for key in self.boss_index if key.startswith(text)]
+        return self.boss_index[matches[0]] if len(matches) == 1 else None
+
+    def split_zone(self, args):
+        """Splits command args into (zone, remaining args); zones may span two words ("open world")."""
+        for n in (2, 1):
+            if len(args) >= n:
+                zone = self.find_zone(" ".join(args[:n]))
+                if zone:
+                    return zone, list(args[n:])
+        return None, list(args)
+
+    def select(self, zone, terms):
+        """Returns ({boss: respawn seconds}, unmatched terms) for the bosses in `zone` matching any term.
+
+        No terms selects the whole zone; a term matches every boss whose name contains it.
+        """
+        bosses = self.zones[zone]
+        if not terms:
+            return dict(bosses), []
+
+        selected, unmatched = {}, []
+        for term in terms:
+            term = term.lower().strip()
+            matches = {name: seconds for name, seconds in bosses.items() if term in name.lower()}
+            if matches:
+                selected.update(matches)
+            else:
+                unmatched.append(term)
+        return selected, unmatched
+
+
+# ✅ Shared catalog instance
+boss_catalog = BossCatalog()
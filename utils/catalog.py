@@ -0,0 +1,214 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # ✅ Windows: no cross-process lock, single-process use only
+    fcntl = None
+
+ITEMS_FILE = "items.json"
+FLUSH_DELAY = 2.0  # ✅ Seconds to coalesce bursts of !add/!del into one write
+MTIME_CHECK_INTERVAL = 5.0  # ✅ How often to look for external edits of items.json
+
+
+class ItemCatalog:
+    """In-memory item -> duration (seconds) catalog backed by items.json.
+
+    Reads are served from memory; when the file's mtime changes it is re-parsed in
+    an executor and swapped in.
+    Writes bump `version` and are persisted write-behind: debounced, written to a
+    temp file in an executor and atomically renamed over items.json. A flush only
+    applies this process's own changes on top of the file's current contents (under
+    a lock file), so shard processes sharing items.json don't drop each other's edits.
+    """
+
+    def __init__(self, path=ITEMS_FILE, flush_delay=FLUSH_DELAY):
+        self.path = path
+        self.flush_delay = flush_delay
+        self.version = 0
+        self._items = {}
+        self._mtime = None
+        self._last_check = 0.0
+        self._dirty = False
+        self._pending = {}  # ✅ item -> duration (None = removed) not yet written
+        self._flush_task = None
+        self._reload_task = None
+        self._load()  # ✅ Startup only; later reloads happen in the background
+
+    @staticmethod
+    def _normalize(data):
+        return {key.lower().strip(): int(value) for key, value in data.items()}
+
+    def _load(self):
+        """(Re)reads items.json into memory."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            logging.warning(f"⚠️ {self.path} not found, starting with an empty catalog.")
+            return
+
+        items = self._read_file()
+        if items is None:
+            logging.warning(f"⚠️ Failed to decode {self.path}! Keeping the previous catalog.")
+        else:
+            self._items = items
+        self._mtime = mtime
+        self.version += 1
+
+    def _read_file(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return self._normalize(json.load(file))
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, ValueError, AttributeError):
+            return None
+
+    def _refresh(self):
+        """Starts a background reload if items.json may have been edited externally.
+
+        Checked at most every MTIME_CHECK_INTERVAL; the stat and the parse run in an
+        executor, so callers get the current in-memory catalog without waiting on disk.
+        """
+        now = time.monotonic()
+        if self._dirty or now - self._last_check < MTIME_CHECK_INTERVAL:
+            return
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        self._last_check = now
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # ✅ No event loop (e.g. a script): nothing to reload into in the background
+        self._reload_task = loop.create_task(self._reload_if_changed())
+
+    async def _reload_if_changed(self):
+        loop = asyncio.get_running_loop()
+        seen = self._mtime
+        try:
+            mtime = await loop.run_in_executor(None, lambda: os.stat(self.path).st_mtime)
+        except FileNotFoundError:
+            return
+        if mtime == self._mtime:
+            return
+        items = await loop.run_in_executor(None, self._read_file)
+        if self._dirty or self._mtime != seen:
+            return  # ✅ Local changes pending or a flush landed meanwhile; the flush merged the file already
+        logging.info(f"🔄 {self.path} changed on disk, reloading catalog.")
+        if items is None:
+            logging.warning(f"⚠️ Failed to decode {self.path}! Keeping the previous catalog.")
+        else:
+            self._items = items
+        self._mtime = mtime
+        self.version += 1
+
+    def items(self):
+        """Returns a snapshot of the catalog."""
+        self._refresh()
+        return dict(self._items)
+
+    def get(self, item_name):
+        """Returns the stored duration for an item, or None."""
+        self._refresh()
+        return self._items.get(item_name.lower().strip())
+
+    def get_many(self, item_names):
+        """Looks up several items with a single freshness check: {item: duration or None}."""
+        self._refresh()
+        return {name: self._items.get(name.lower().strip()) for name in item_names}
+
+    def __contains__(self, item_name):
+        return self.get(item_name) is not None
+
+    def set(self, item_name, duration):
+        """Stores an item duration and schedules a write-behind flush."""
+        item_name = item_name.lower().strip()
+        self._items[item_name] = self._pending[item_name] = int(duration)
+        self._mark_dirty()
+
+    def remove(self, item_name):
+        """Removes an item. Returns True if it existed."""
+        item_name = item_name.lower().strip()
+        if self._items.pop(item_name, None) is None:
+            return False
+        self._pending[item_name] = None
+        self._mark_dirty()
+        return True
+
+    def _mark_dirty(self):
+        self.version += 1
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        while self._dirty:  # ✅ Picks up changes made while a write was in flight
+            await asyncio.sleep(self.flush_delay)
+            await self.flush()
+
+    async def flush(self):
+        """Persists pending changes now (merged into the file's current contents, atomic rename, in an executor)."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        pending, self._pending = self._pending, {}
+        loop = asyncio.get_running_loop()
+        try:
+            merged, self._mtime = await loop.run_in_executor(None, self._merge_and_write, pending)
+        except OSError as e:
+            self._pending = {**pending, **self._pending}
+            self._dirty = True  # ✅ Retry on the next change/flush
+            logging.error(f"❌ Failed to save {self.path}: {e}")
+            return
+
+        merged.update(self._pending)  # ✅ Changes made while the write was in flight
+        self._items = {name: duration for name, duration in merged.items() if duration is not None}
+        self.version += 1
+        logging.debug(f"💾 Saved {len(merged)} items to {self.path}")
+
+    def _merge_and_write(self, pending):
+        with self._file_lock():
+            items = self._read_file()
+            if items is None:
+                items = dict(self._items)  # ✅ Unreadable file: fall back to our own view
+            for name, duration in pending.items():
+                if duration is None:
+                    items.pop(name, None)
+                else:
+                    items[name] = duration
+            return items, self._write_atomic(dict(sorted(items.items())))
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_atomic(self, snapshot):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".items-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file, indent=4, ensure_ascii=False)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return os.stat(self.path).st_mtime
+
+
+# ✅ Shared catalog instance
+item_catalog = ItemCatalog()
@@ -0,0 +1,21 @@
+import aiohttp
+
+# ✅ One pooled HTTP session for every outbound download (created lazily inside the event loop)
+_session = None
+
+def get_session():
+    """Returns the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _session
+
+async def close_session():
+    """Closes the shared session (call on shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
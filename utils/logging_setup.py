@@ -0,0 +1,62 @@
+import atexit
+import itertools
+import logging
+import logging.handlers
+import queue
+import config
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+
+class DebugSampler(logging.Filter):
+    """Lets every Nth DEBUG record through; other levels always pass."""
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = max(1, every)
+        self._seen = itertools.count()
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        return next(self._seen) % self.every == 0
+
+
+def _file_handler():
+    if config.LOG_ROTATE_WHEN:
+        # ✅ Time-based rotation (e.g. "midnight", "h")
+        return logging.handlers.TimedRotatingFileHandler(
+            config.LOG_FILE, when=config.LOG_ROTATE_WHEN, backupCount=config.LOG_BACKUPS, encoding="utf-8"
+        )
+    return logging.handlers.RotatingFileHandler(
+        config.LOG_FILE, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUPS, encoding="utf-8"
+    )
+
+
+def setup_logging():
+    """Routes all logging through a queue so file and console writes happen on a background thread.
+
+    The event loop only formats the record and puts it on the queue; the listener
+    thread does the disk and stdout I/O. DEBUG output is level-gated by LOG_LEVEL
+    and sampled by LOG_DEBUG_SAMPLE.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = _file_handler()
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(DebugSampler(config.LOG_DEBUG_SAMPLE))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(config.LOG_LEVEL)
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # ✅ Flush whatever is still queued on shutdown
+    return listener
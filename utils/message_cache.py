@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+from utils import rest
+
+MAX_MESSAGES = 5000  # ✅ Upper bound on cached Message objects
+MAX_AGE = 6 * 3600  # ✅ Seconds before a cached Message is considered stale
+
+
+class MessageCache:
+    """LRU cache of tracked Message objects, bounded by count and age.
+
+    Lets the raw reaction path skip `fetch_message` for messages the bot posted itself.
+    """
+
+    def __init__(self, max_messages=MAX_MESSAGES, max_age=MAX_AGE):
+        self.max_messages = max_messages
+        self.max_age = max_age
+        self._messages = OrderedDict()  # ✅ message ID -> (Message, cached_at)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._messages)
+
+    def put(self, message):
+        """Caches (or refreshes) a message as most recently used."""
+        self._messages[message.id] = (message, time.monotonic())
+        self._messages.move_to_end(message.id)
+        while len(self._messages) > self.max_messages:
+            self._messages.popitem(last=False)
+
+    def get(self, message_id):
+        """Returns the cached message, or None on a miss or if it has expired."""
+        entry = self._messages.get(message_id)
+        if entry and time.monotonic() - entry[1] <= self.max_age:
+            self._messages.move_to_end(message_id)
+            self.hits += 1
+            return entry[0]
+
+        if entry:
+            del self._messages[message_id]  # ✅ Expired
+        self.misses += 1
+        return None
+
+    def discard(self, message_id):
+        self._messages.pop(message_id, None)
+
+    async def fetch(self, channel, message_id):
+        """Returns the message from cache, falling back to `channel.fetch_message` on a miss."""
+        message = self.get(message_id)
+        if message is None:
+            message = await rest.fetch_message(channel, message_id)
+            self.put(message)
+        return message
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# ✅ Shared cache instance
+message_cache = MessageCache()
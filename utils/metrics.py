@@ -0,0 +1,165 @@
+import bisect
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from aiohttp import web
+import config
+
+# ✅ Name of the operation (command or reaction action) the current task is serving
+current_operation = contextvars.ContextVar("current_operation", default="background")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_metrics = []
+
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.values = {}
+        _metrics.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_label_text(key)} {value}" for key, value in self.values.items()]
+        return lines
+
+
+class Gauge:
+    """Gauge read from a callback at scrape time; the callback returns a number or {label tuple: number}."""
+
+    def __init__(self, name, help_text, callback, label=None):
+        self.name = name
+        self.help = help_text
+        self.callback = callback
+        self.label = label
+        _metrics.append(self)
+
+    def read(self):
+        try:
+            value = self.callback()
+        except Exception:
+            return {}
+        if isinstance(value, dict):
+            return {((self.label, key),): amount for key, amount in value.items()}
+        return {(): value}
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        lines += [f"{self.name}{_label_text(key)} {value}" for key, value in self.read().items()]
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels."""
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        self.series = {}  # ✅ label key -> [bucket counts..., +Inf count, sum]
+        _metrics.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, **labels):
+        series = self.series.get(tuple(sorted(labels.items())))
+        return sum(series[:-1]) if series else 0
+
+    def quantile(self, q, **labels):
+        """Upper bucket bound containing the q-quantile (None without samples)."""
+        series = self.series.get(tuple(sorted(labels.items())))
+        total = sum(series[:-1]) if series else 0
+        if not total:
+            return None
+        rank, seen = q * total, 0
+        for index, bucket_count in enumerate(series[:-1]):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, series in self.series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_label_text(key + (('le', bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_label_text(key)} {series[-1]}")
+            lines.append(f"{self.name}_count{_label_text(key)} {cumulative}")
+        return lines
+
+
+def render_all():
+    """Renders every registered metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ✅ Hot-path metrics
+
+COMMAND_LATENCY = Histogram("countdown_command_seconds", "Command handler latency")
+REACTION_LATENCY = Histogram("countdown_reaction_seconds", "Reaction handler latency by action")
+REST_CALLS = Counter("countdown_rest_calls_total", "Discord REST calls by operation and call kind")
+REACTIONS_DROPPED = Counter("countdown_reactions_dropped_total", "Reactions on events that were already moved or deleted")
+EVENTS_SWEPT = Counter("countdown_events_swept_total", "Expired events evicted by the sweeper")
+SCHEDULER_LAG = Histogram("countdown_scheduler_lag_seconds", "How late timers fire after their deadline")
+
+
+@contextmanager
+def timed(histogram, operation, **labels):
+    """Times a block into `histogram` and tags REST calls made inside it with `operation`."""
+    token = current_operation.set(operation)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+        current_operation.reset(token)
+
+
+# ✅ Local Prometheus endpoint
+
+async def _handle_metrics(request):
+    return web.Response(text=render_all(), content_type="text/plain", charset="utf-8")
+
+async def start_metrics_server(host=config.METRICS_HOST, port=config.METRICS_PORT):
+    """Serves /metrics on host:port (disabled when port is 0)."""
+    if not port:
+        return None
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        # ✅ e.g. port taken by another instance: run without the endpoint rather than abort startup
+        logging.error(f"❌ Metrics endpoint disabled, could not bind {host}:{port}: {e}")
+        await runner.cleanup()
+        return None
+    logging.info(f"📈 Metrics available at http://{host}:{port}/metrics")
+    return runner
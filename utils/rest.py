@@ -0,0 +1,229 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import discord
+from utils.metrics import REST_CALLS, current_operation
+
+# ✅ Priority classes, most urgent first
+PING, POST, REACTION, CLEANUP = range(4)
+PRIORITY_NAMES = {PING: "ping", POST: "post", REACTION: "reaction", CLEANUP: "cleanup"}
+
+# ✅ Concurrent calls per channel lane: few enough that calls wait here, in priority order,
+# rather than in discord.py's bucket lock (which serves them first come, first served)
+LANE_WORKERS = 2
+REACTION_KINDS = ("add_reaction", "remove_reaction")
+MAX_QUEUED = 500  # ✅ Per priority class; submitters wait once a class is full
+
+
+class _Op:
+    __slots__ = ("priority", "kind", "key", "lane", "factory", "future", "queued_at", "cancelled", "operation")
+
+    def __init__(self, priority, kind, key, lane, factory):
+        self.operation = current_operation.get()  # ✅ Captured here, workers run in their own context
+        self.priority = priority
+        self.kind = kind
+        self.key = key
+        self.lane = lane
+        self.factory = factory
+        self.future = asyncio.get_running_loop().create_future()
+        self.queued_at = time.monotonic()
+        self.cancelled = False
+
+
+class _Lane:
+    """Priority heap and worker count for one channel (or DM/guild)."""
+
+    __slots__ = ("heap", "workers")
+
+    def __init__(self):
+        self.heap = []
+        self.workers = 0
+
+
+class RestDispatcher:
+    """Prioritized queues that every outbound Discord REST call goes through.
+
+    Calls are queued per channel lane, which is where Discord's rate-limit buckets
+    make them compete: within a lane reminder pings go before event posts, posts
+    before reactions and reactions before cleanup, while different channels never
+    wait on each other. Operations on the same message are merged while they are
+    still queued: a delete drops pending edits and reactions, repeated edits keep
+    only the latest one and repeated deletes share one call.
+    """
+
+    def __init__(self, lane_workers=LANE_WORKERS, max_queued=MAX_QUEUED):
+        self.lane_workers = lane_workers
+        self.max_queued = max_queued
+        self._lanes = {}  # ✅ lane -> _Lane, dropped once drained
+        self._seq = itertools.count()
+        self._slots = None
+        self._by_key = {}  # ✅ key -> {kind: queued op}
+        self._tasks = set()
+        self.depth = {priority: 0 for priority in PRIORITY_NAMES}
+        self.wait_total = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self.wait_max = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "coalesced": 0}
+
+    async def submit(self, priority, kind, factory, key=None, lane=None):
+        """Queues `factory()` (a coroutine function) on `lane` and returns its result once it has run."""
+        if self._slots is None:
+            self._slots = {priority: asyncio.Semaphore(self.max_queued) for priority in PRIORITY_NAMES}
+        self.stats["submitted"] += 1
+        await self._slots[priority].acquire()  # ✅ Backpressure when this class is full
+
+        pending = self._by_key.setdefault(key, {}) if key is not None else {}
+        if kind == "delete" and "delete" in pending:
+            return await self._coalesce(priority, pending["delete"])
+        if kind == "edit" and "delete" in pending:
+            self._slots[priority].release()
+            self.stats["coalesced"] += 1
+            return None  # ✅ Message is about to be deleted anyway
+        if kind == "edit" and "edit" in pending:
+            pending["edit"].factory = factory  # ✅ Latest edit wins
+            return await self._coalesce(priority, pending["edit"])
+        if kind == "delete" and "edit" in pending:
+            self._drop(pending.pop("edit"))
+        if kind == "delete":
+            for queued in pending.pop("reactions", ()):
+                self._drop(queued)  # ✅ No point seeding a message that is about to go
+
+        op = _Op(priority, kind, key, lane, factory)
+        if key is not None and kind in REACTION_KINDS:
+            pending.setdefault("reactions", set()).add(op)
+        elif key is not None:
+            pending[kind] = op
+        queue = self._lanes.get(lane)
+        if queue is None:
+            queue = self._lanes[lane] = _Lane()
+        heapq.heappush(queue.heap, (priority, next(self._seq), op))
+        self.depth[priority] += 1
+        if queue.workers < self.lane_workers:
+            queue.workers += 1
+            task = asyncio.create_task(self._worker(lane, queue))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return await op.future
+
+    async def _coalesce(self, priority, op):
+        self._slots[priority].release()
+        self.stats["coalesced"] += 1
+        return await asyncio.shield(op.future)
+
+    def _drop(self, op):
+        """Cancels a queued op; it stays in the heap but is skipped by the workers."""
+        op.cancelled = True
+        self.depth[op.priority] -= 1
+        self._slots[op.priority].release()
+        self.stats["coalesced"] += 1
+        if not op.future.done():
+            op.future.set_result(None)
+
+    def _unregister(self, op):
+        pending = self._by_key.get(op.key)
+        if pending is not None:
+            if op.kind in REACTION_KINDS:
+                reactions = pending.get("reactions", set())
+                reactions.discard(op)
+                if not reactions:
+                    pending.pop("reactions", None)
+            elif pending.get(op.kind) is op:
+                del pending[op.kind]
+            if not pending:
+                del self._by_key[op.key]
+
+    async def _worker(self, lane, queue):
+        """Drains one lane, then exits (the lane is dropped with its last worker)."""
+        try:
+            while queue.heap:
+                _, _, op = heapq.heappop(queue.heap)
+                if op.key is not None:
+                    self._unregister(op)
+                if op.cancelled:
+                    continue
+                await self._run(op)
+        finally:
+            queue.workers -= 1
+            if not queue.workers and not queue.heap and self._lanes.get(lane) is queue:
+                del self._lanes[lane]
+
+    async def _run(self, op):
+        self.depth[op.priority] -= 1
+        self._slots[op.priority].release()
+        waited = time.monotonic() - op.queued_at
+        self.wait_total[op.priority] += waited
+        self.wait_max[op.priority] = max(self.wait_max[op.priority], waited)
+
+        REST_CALLS.inc(operation=op.operation, kind=op.kind)
+        try:
+            result = await op.factory()
+            self.stats["completed"] += 1
+            if not op.future.done():
+                op.future.set_result(result)
+        except Exception as e:
+            self.stats["failed"] += 1
+            if not op.future.done():
+                op.future.set_exception(e)
+            else:
+                logging.warning(f"⚠️ Dropped {op.kind} failed: {e}")
+
+    @property
+    def queue_depth(self):
+        return sum(self.depth.values())
+
+
+# ✅ Shared dispatcher instance
+dispatcher = RestDispatcher()
+
+def lane_of(target):
+    """Queue lane for a call: the channel of a message/context, else the target's own ID (channel, DM user, guild)."""
+    channel = getattr(target, "channel", None)
+    return getattr(channel, "id", None) or getattr(target, "id", None)
+
+_background = set()  # ✅ Keep references to fire-and-forget calls
+
+def fire_and_forget(coro):
+    """Runs a call (typically a CLEANUP delete) without awaiting it; failures are logged, not raised."""
+    task = asyncio.ensure_future(coro)
+    _background.add(task)
+    task.add_done_callback(_log_background_failure)
+    return task
+
+def _log_background_failure(task):
+    _background.discard(task)
+    if task.cancelled() or task.exception() is None or isinstance(task.exception(), discord.NotFound):
+        return  # ✅ Already gone is fine for cleanup
+    logging.warning(f"⚠️ Background REST call failed: {task.exception()}")
+
+# ✅ Call helpers: every outbound Discord call in the bot goes through one of these
+
+async def send(destination, *args, priority=POST, **kwargs):
+    return await dispatcher.submit(priority, "send", lambda: destination.send(*args, **kwargs), lane=lane_of(destination))
+
+async def edit(message, priority=POST, **kwargs):
+    return await dispatcher.submit(priority, "edit", lambda: message.edit(**kwargs), key=message.id, lane=lane_of(message))
+
+async def delete(message, priority=CLEANUP):
+    return await dispatcher.submit(priority, "delete", lambda: message.delete(), key=message.id, lane=lane_of(message))
+
+async def delete_messages(channel, message_ids, priority=CLEANUP):
+    """Bulk-deletes messages by ID, in calls of at most 100 (Discord's limit)."""
+    for i in range(0, len(message_ids), 100):
+        chunk = [discord.Object(id=message_id) for message_id in message_ids[i:i + 100]]
+        await dispatcher.submit(priority, "delete_messages", lambda chunk=chunk: channel.delete_messages(chunk), lane=lane_of(channel))
+
+async def add_reaction(message, emoji, priority=REACTION):
+    return await dispatcher.submit(priority, "add_reaction", lambda: message.add_reaction(emoji), key=message.id, lane=lane_of(message))
+
+async def remove_reaction(message, emoji, member, priority=REACTION):
+    return await dispatcher.submit(priority, "remove_reaction", lambda: message.remove_reaction(emoji, member), key=message.id, lane=lane_of(message))
+
+async def pin(message, priority=POST):
+    return await dispatcher.submit(priority, "pin", lambda: message.pin(), lane=lane_of(message))
+
+async def create_text_channel(guild, priority=POST, **kwargs):
+    return await dispatcher.submit(priority, "create_channel", lambda: guild.create_text_channel(**kwargs), lane=lane_of(guild))
+
+async def fetch_message(channel, message_id, priority=POST):
+    return await dispatcher.submit(priority, "fetch_message", lambda: channel.fetch_message(message_id), lane=lane_of(channel))
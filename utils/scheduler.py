@@ -0,0 +1,102 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from utils.metrics import SCHEDULER_LAG
+
+
+class TimerScheduler:
+    """Deadline-driven timer heap keyed on absolute fire time (epoch seconds)."""
+
+    def __init__(self):
+        self._heap = []  # ✅ (fire_at, seq, key) entries, stale ones are skipped lazily
+        self._timers = {}  # ✅ key -> (fire_at, seq, callback) for the live entry
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._running = set()  # ✅ Keep references to in-flight callbacks
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key):
+        return key in self._timers
+
+    def deadline(self, key):
+        """Returns the fire time for `key`, or None if it isn't scheduled."""
+        timer = self._timers.get(key)
+        return timer[0] if timer else None
+
+    def schedule(self, key, fire_at, callback):
+        """Schedules (or reschedules) `callback()` to run at `fire_at`. O(log n)."""
+        seq = next(self._seq)
+        self._timers[key] = (fire_at, seq, callback)
+        heapq.heappush(self._heap, (fire_at, seq, key))
+
+        # ✅ Only wake the runner if this is now the earliest deadline
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+
+        self._maybe_compact()
+
+    def cancel(self, key):
+        """Cancels a pending timer. Returns True if one was scheduled."""
+        return self._timers.pop(key, None) is not None
+
+    def _maybe_compact(self):
+        """Rebuilds the heap once cancelled/rescheduled entries outnumber live ones."""
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._timers):
+            self._heap = [(fire_at, seq, key) for key, (fire_at, seq, _) in self._timers.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_due(self, now):
+        """Pops every live timer whose deadline has passed (catches up after a stall)."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, seq, key = heapq.heappop(self._heap)
+            timer = self._timers.get(key)
+            if not timer or timer[1] != seq:
+                continue  # ✅ Stale entry (cancelled or rescheduled)
+            del self._timers[key]
+            due.append((key, fire_at, timer[2]))
+        return due
+
+    def _next_delay(self, now):
+        """Seconds until the earliest live deadline, or None if nothing is scheduled."""
+        while self._heap:
+            fire_at, seq, key = self._heap[0]
+            timer = self._timers.get(key)
+            if timer and timer[1] == seq:
+                return max(0.0, fire_at - now)
+            heapq.heappop(self._heap)  # ✅ Drop stale head
+        return None
+
+    async def _fire(self, key, fire_at, callback):
+        lag = time.time() - fire_at
+        SCHEDULER_LAG.observe(max(0.0, lag))
+        if lag > 5:
+            logging.warning(f"⏰ Timer {key} fired {lag:.1f}s late (catching up)")
+        try:
+            await callback()
+        except Exception:
+            logging.exception(f"❌ Timer callback failed for {key}")
+
+    async def run(self):
+        """Sleeps until the next deadline and fires every timer that is due."""
+        while True:
+            now = time.time()
+            for key, fire_at, callback in self._pop_due(now):
+                # ✅ Run callbacks concurrently so a slow send can't delay other timers
+                task = asyncio.create_task(self._fire(key, fire_at, callback))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+            self._wakeup.clear()
+            delay = self._next_delay(time.time())
+            if delay == 0:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,104 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import discord
+from utils import rest
+from utils.metrics import current_operation
+
+# ✅ Discord's reaction route (PUT .../reactions/{emoji}/@me) is bucketed per channel
+# and allows roughly one request every 250ms.
+REACTION_INTERVAL = 0.25
+
+# ✅ Reactions users need first go out first (lower = sooner)
+REACTION_PRIORITY = {"✅": 0, "🗑️": 1, "🔔": 2, "📥": 3}
+DEFAULT_PRIORITY = 4
+
+
+class _SeedJob:
+    """Tracks one message's pending reactions so latency can be reported when the last one lands."""
+
+    __slots__ = ("message_id", "pending", "started", "done", "operation")
+
+    def __init__(self, message_id, count):
+        self.message_id = message_id
+        self.operation = current_operation.get()  # ✅ Seeding REST calls count towards the caller's operation
+        self.pending = count
+        self.started = time.monotonic()
+        self.done = asyncio.get_running_loop().create_future()
+
+
+class ReactionSeeder:
+    """Seeds reactions on new event messages, paced by each channel's rate-limit bucket.
+
+    Requests are started as soon as the bucket allows instead of waiting for the
+    previous response, and a burst of posts in one channel gets every message's ✅
+    before anyone's sharing reactions.
+    """
+
+    def __init__(self, interval=REACTION_INTERVAL):
+        self.interval = interval
+        self._queues = {}  # ✅ channel ID -> heap of (priority, seq, message, emoji, job)
+        self._workers = {}  # ✅ channel ID -> pacing task
+        self._requests = set()
+        self._seq = itertools.count()
+        self.stats = {"messages": 0, "reactions": 0, "failures": 0, "total_latency": 0.0, "max_latency": 0.0}
+
+    def seed(self, message, emojis):
+        """Queues reactions for `message` and returns a future resolving to the seeding latency (seconds)."""
+        job = _SeedJob(message.id, len(emojis))
+        if not emojis:
+            job.done.set_result(0.0)
+            return job.done
+
+        channel_id = message.channel.id
+        queue = self._queues.setdefault(channel_id, [])
+        for emoji in emojis:
+            priority = REACTION_PRIORITY.get(emoji, DEFAULT_PRIORITY)
+            heapq.heappush(queue, (priority, next(self._seq), message, emoji, job))
+
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(self._drain(channel_id))
+        return job.done
+
+    async def _drain(self, channel_id):
+        """Dispatches one queued reaction per bucket interval until the channel queue is empty."""
+        queue = self._queues[channel_id]
+        while queue:
+            _, _, message, emoji, job = heapq.heappop(queue)
+            request = asyncio.create_task(self._add(message, emoji, job))
+            self._requests.add(request)
+            request.add_done_callback(self._requests.discard)
+            await asyncio.sleep(self.interval)
+        del self._queues[channel_id]
+        self._workers.pop(channel_id, None)
+
+    async def _add(self, message, emoji, job):
+        current_operation.set(job.operation)  # ✅ Local to this request's task
+        try:
+            await rest.add_reaction(message, emoji)
+            self.stats["reactions"] += 1
+        except discord.NotFound:
+            pass  # ✅ Message was deleted before seeding finished
+        except discord.HTTPException as e:
+            self.stats["failures"] += 1
+            logging.warning(f"⚠️ Failed to add {emoji} to message {message.id}: {e}")
+        finally:
+            job.pending -= 1
+            if job.pending == 0:
+                self._finish(job)
+
+    def _finish(self, job):
+        latency = time.monotonic() - job.started
+        self.stats["messages"] += 1
+        self.stats["total_latency"] += latency
+        self.stats["max_latency"] = max(self.stats["max_latency"], latency)
+        logging.debug(f"🌱 Seeded reactions on message {job.message_id} in {latency * 1000:.0f}ms")
+        if not job.done.done():
+            job.done.set_result(latency)
+
+
+# ✅ Shared seeder instance
+reaction_seeder = ReactionSeeder()
@@ -0,0 +1,12 @@
+import config
+
+def shard_for_guild(guild_id, shard_count=None):
+    """Discord's shard formula; DMs (no guild) are delivered to shard 0."""
+    shard_count = shard_count or config.SHARD_COUNT or 1
+    return (guild_id >> 22) % shard_count if guild_id else 0
+
+def owns_guild(guild_id):
+    """True if this process's shards receive the guild's events (and so own its timers)."""
+    if not config.SHARD_COUNT or config.SHARD_IDS is None:
+        return True
+    return shard_for_guild(guild_id) in config.SHARD_IDS
@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import time
+import config
+
+# ✅ Fixed-size little-endian records: time, event ID, item key, spawn time, duration, action
+RECORD = struct.Struct("<qqQqiB3x")
+CREATE, RESET, SHARE, CLAIM = range(4)
+ACTION_NAMES = {CREATE: "create", RESET: "reset", SHARE: "share", CLAIM: "claim"}
+
+FLUSH_DELAY = 5.0  # ✅ Seconds to batch appends into one write
+MIN_SAMPLES = 5  # ✅ Resets needed before an item gets a suggestion
+MIN_CHANGE = 60  # ✅ Ignore suggestions closer than this (seconds) to the stored duration
+
+
+def item_key(item_name):
+    """Stable 64-bit key for an item name (process-independent, so shard processes can share the log)."""
+    return int.from_bytes(hashlib.blake2b(item_name.lower().strip().encode(), digest_size=8).digest(), "little")
+
+
+def read_names(names_path):
+    """Reads the {item key: name} sidecar."""
+    names = {}
+    try:
+        with open(names_path, "r", encoding="utf-8") as file:
+            for line in file:
+                key, _, name = line.rstrip("\n").partition(" ")
+                if key.isdigit():
+                    names[int(key)] = name
+    except FileNotFoundError:
+        pass
+    return names
+
+
+class SpawnHistory:
+    """Append-only binary log of event creates/resets/shares/claims.
+
+    Records are buffered in memory and appended in batches from an executor.
+    Item names live in a small `<path>.names` sidecar keyed by item_key().
+    """
+
+    def __init__(self, path=config.SPAWN_HISTORY_FILE):
+        self.path = path
+        self._buffer = bytearray()
+        self._names = read_names(self.names_path)  # ✅ key -> name, for names already in the sidecar
+        self._new_names = {}
+        self._flush_task = None
+
+    @property
+    def names_path(self):
+        return self.path + ".names"
+
+    def record(self, action, record, now=None):
+        """Logs an action on an EventRecord (its spawn time/duration as they were when the action happened)."""
+        key = item_key(record.item_name)
+        if key not in self._names and key not in self._new_names:
+            self._new_names[key] = record.item_name.lower().strip()
+        self._buffer += RECORD.pack(
+            int(now if now is not None else time.time()), record.message_id, key,
+            record.spawn_time, record.original_duration, action,
+        )
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(FLUSH_DELAY)
+        await self.flush()
+
+    async def flush(self):
+        if not self._buffer and not self._new_names:
+            return
+        data, self._buffer = bytes(self._buffer), bytearray()
+        names, self._new_names = self._new_names, {}
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._append, data, names)
+            self._names.update(names)
+        except OSError as e:
+            self._buffer = bytearray(data) + self._buffer
+            self._new_names.update(names)
+            logging.error(f"❌ Failed to append to {self.path}: {e}")
+
+    def _append(self, data, names):
+        if names:
+            with open(self.names_path, "a", encoding="utf-8") as file:
+                file.writelines(f"{key} {name}\n" for key, name in names.items())
+        with open(self.path, "ab") as file:
+            file.write(data)  # ✅ One O_APPEND write per batch of whole records
+
+
+def analyze(path=config.SPAWN_HISTORY_FILE):
+    """Loads the log with NumPy and returns observed reset intervals per item name.
+
+    The interval of a reset is the time since that timer was (re)started, i.e.
+    reset time - (previous spawn time - duration). Outliers are outside
+    1.5 IQR of the item's quartiles and are left out of the suggestion.
+    """
+    import numpy as np  # ✅ Only needed for the analysis command
+
+    dtype = np.dtype([
+        ("time", "<i8"), ("event", "<i8"), ("item", "<u8"), ("spawn", "<i8"), ("duration", "<i4"),
+        ("action", "u1"), ("pad", "V3"),
+    ])
+    assert dtype.itemsize == RECORD.size
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        return {}
+    log = np.fromfile(path, dtype=dtype, count=size // RECORD.size)
+
+    resets = log[log["action"] == RESET]
+    if not len(resets):
+        return {}
+    intervals = resets["time"] - (resets["spawn"] - resets["duration"])
+    valid = intervals > 0
+    resets, intervals = resets[valid], intervals[valid]
+
+    # ✅ One sort groups every item's intervals together, in order
+    order = np.lexsort((intervals, resets["item"]))
+    items, intervals = resets["item"][order], intervals[order]
+    keys, starts, counts = np.unique(items, return_index=True, return_counts=True)
+
+    def quantile(values, counts, q):
+        """Per-group q-quantile of `values` (sorted within each group), interpolated like np.quantile."""
+        position = q * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, counts - 1)
+        low, high = values[starts + lower], values[starts + upper]
+        return low + (high - low) * (position - lower)
+
+    q1, median, q3, p90 = (quantile(intervals, counts, q) for q in (0.25, 0.5, 0.75, 0.9))
+    iqr = q3 - q1
+    group = np.repeat(np.arange(len(keys)), counts)
+    inlier = (intervals >= (q1 - 1.5 * iqr)[group]) & (intervals <= (q3 + 1.5 * iqr)[group])
+    outliers = counts - np.bincount(group, weights=inlier, minlength=len(keys)).astype(np.int64)
+
+    # ✅ Median of the inliers: masked values sort to the end of each group
+    masked = np.where(inlier, intervals, np.iinfo(np.int64).max)
+    masked_order = np.lexsort((masked, group))
+    inlier_counts = np.maximum(counts - outliers, 1)
+    robust = quantile(masked[masked_order], inlier_counts, 0.5)
+
+    names = read_names(path + ".names")
+    return {
+        names.get(int(key), f"#{key:x}"): {
+            "samples": int(counts[i]),
+            "median": round(median[i]),
+            "p90": round(p90[i]),
+            "outliers": int(outliers[i]),
+            "suggested": round(robust[i]),
+        }
+        for i, key in enumerate(keys)
+    }
+
+
+def suggestions(stats, catalog_items, min_samples=MIN_SAMPLES, min_change=MIN_CHANGE):
+    """Returns {item: (stored, suggested)} for catalog items whose observed interval differs enough."""
+    result = {}
+    for name, item_stats in stats.items():
+        stored = catalog_items.get(name)
+        if stored is None or item_stats["samples"] < min_samples:
+            continue
+        if abs(item_stats["suggested"] - stored) >= min_change:
+            result[name] = (stored, item_stats["suggested"])
+    return result
+
+
+# ✅ Shared log instance
+spawn_history = SpawnHistory()
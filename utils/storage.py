@@ -0,0 +1,309 @@
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    message_id INTEGER PRIMARY KEY,
+    guild_id INTEGER,
+    channel_id INTEGER NOT NULL,
+    spawn_time INTEGER NOT NULL,
+    original_duration INTEGER NOT NULL,
+    negative_offset INTEGER NOT NULL DEFAULT 0,
+    item_name TEXT NOT NULL,
+    rarity_name TEXT NOT NULL DEFAULT '',
+    color TEXT NOT NULL DEFAULT '',
+    amount INTEGER NOT NULL DEFAULT 1,
+    creator_name TEXT NOT NULL DEFAULT '',
+    image_url TEXT,
+    image_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_channel ON events (channel_id, spawn_time);
+CREATE INDEX IF NOT EXISTS idx_events_spawn ON events (spawn_time);
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    message_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    PRIMARY KEY (message_id, user_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS pings_sent (
+    message_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    due INTEGER NOT NULL,
+    PRIMARY KEY (message_id, user_id, due)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ping_preferences (
+    user_id INTEGER PRIMARY KEY,
+    lead_times TEXT NOT NULL,
+    dm INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS reminders (
+    event_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    message_id INTEGER NOT NULL,
+    PRIMARY KEY (event_id, message_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS boss_timers (
+    message_id INTEGER NOT NULL,
+    boss_name TEXT NOT NULL,
+    respawn INTEGER NOT NULL,
+    spawn_time INTEGER NOT NULL,
+    PRIMARY KEY (message_id, boss_name)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS boards (
+    channel_id INTEGER PRIMARY KEY,
+    message_id INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS id_sequences (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS intel_channels (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    PRIMARY KEY (guild_id, user_id)
+) WITHOUT ROWID;
+"""
+
+BUSY_TIMEOUT = 30  # ✅ Seconds to wait for another shard process's write lock
+
+EVENT_COLUMNS = (
+    "message_id", "guild_id", "channel_id", "spawn_time", "original_duration", "negative_offset",
+    "item_name", "rarity_name", "color", "amount", "creator_name", "image_url", "image_hash",
+)
+
+
+def _parse_lead_times(text):
+    """"1800,900,300" -> (1800, 900, 300)"""
+    return tuple(int(lead) for lead in text.split(",") if lead)
+
+
+class EventStore:
+    """SQLite (WAL) persistence for tracked events and 🔔 subscriptions.
+
+    Every query runs on a single dedicated thread, so the event loop never blocks
+    on disk I/O and writes are applied in the order they were submitted. Shard
+    processes on the same host share one database file.
+    """
+
+    def __init__(self, path=config.DATABASE_FILE):
+        self.path = path
+        self._conn = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-store")
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._migrate()
+            logging.info(f"🗄️ Event store opened at {self.path}")
+        return self._conn
+
+    def _migrate(self):
+        """Adds columns introduced after a database was created."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(events)")}
+        if "image_hash" not in columns:
+            try:
+                self._conn.execute("ALTER TABLE events ADD COLUMN image_hash TEXT")
+            except sqlite3.OperationalError:
+                pass  # ✅ Another shard process added it first
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # ✅ Synchronous helpers (executor thread only)
+
+    def _execute(self, sql, params=()):
+        conn = self._connection()
+        with conn:
+            conn.execute(sql, params)
+
+    def _query(self, sql, params=()):
+        return [dict(row) for row in self._connection().execute(sql, params)]
+
+    def _load_all(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN")  # ✅ One read transaction: a consistent snapshot even while other shard processes write
+            events = [dict(row) for row in conn.execute("SELECT * FROM events")]
+            subscriptions = conn.execute("SELECT message_id, user_id FROM subscriptions").fetchall()
+            reminder_rows = conn.execute("SELECT event_id, channel_id, message_id FROM reminders").fetchall()
+            boss_rows = conn.execute("SELECT message_id, boss_name, respawn, spawn_time FROM boss_timers").fetchall()
+            boards = dict(conn.execute("SELECT channel_id, message_id FROM boards").fetchall())
+            preference_rows = conn.execute("SELECT user_id, lead_times, dm FROM ping_preferences").fetchall()
+        pings = {}
+        for message_id, user_id in subscriptions:
+            pings.setdefault(message_id, set()).add(user_id)
+        reminders = {}
+        for event_id, channel_id, message_id in reminder_rows:
+            reminders.setdefault(event_id, {}).setdefault(channel_id, []).append(message_id)
+        boss_timers = {}
+        for message_id, boss_name, respawn, spawn_time in boss_rows:
+            boss_timers.setdefault(message_id, {})[boss_name] = (respawn, spawn_time)
+        preferences = {user_id: (_parse_lead_times(lead_times), bool(dm)) for user_id, lead_times, dm in preference_rows}
+        return {
+            "events": events, "pings": pings, "reminders": reminders, "boss_timers": boss_timers, "boards": boards,
+            "ping_preferences": preferences,
+        }
+
+    # ✅ Events
+
+    async def save_event(self, row):
+        """Inserts or replaces an event row (a dict keyed by EVENT_COLUMNS)."""
+        placeholders = ", ".join("?" for _ in EVENT_COLUMNS)
+        sql = f"INSERT OR REPLACE INTO events ({', '.join(EVENT_COLUMNS)}) VALUES ({placeholders})"
+        await self._run(self._execute, sql, tuple(row.get(col) for col in EVENT_COLUMNS))
+
+    async def delete_event(self, message_id):
+        """Removes an event and everything attached to it."""
+        def delete():
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM events WHERE message_id = ?", (message_id,))
+                conn.execute("DELETE FROM subscriptions WHERE message_id = ?", (message_id,))
+                conn.execute("DELETE FROM pings_sent WHERE message_id = ?", (message_id,))
+                conn.execute("DELETE FROM boss_timers WHERE message_id = ?", (message_id,))
+        await self._run(delete)
+
+    async def events_in_channel(self, channel_id):
+        """Returns all events in a channel, soonest spawn first."""
+        return await self._run(self._query, "SELECT * FROM events WHERE channel_id = ? ORDER BY spawn_time", (channel_id,))
+
+    async def events_spawning_before(self, timestamp):
+        """Returns all events whose spawn time is at or before `timestamp`, soonest first."""
+        return await self._run(self._query, "SELECT * FROM events WHERE spawn_time <= ? ORDER BY spawn_time", (timestamp,))
+
+    async def load_all(self):
+        """Bulk-loads everything needed to rehydrate memory: event rows, the {message_id: {user_ids}}
+        subscription map, the {event_id: {channel_id: [message_ids]}} reminder index and the
+        {message_id: {boss: (respawn, spawn_time)}} zone timers, the {channel_id: message_id} boards and
+        the {user_id: (lead_times, dm)} reminder preferences."""
+        return await self._run(self._load_all)
+
+    # ✅ Subscriptions
+
+    async def add_subscription(self, message_id, user_id):
+        await self._run(self._execute, "INSERT OR IGNORE INTO subscriptions (message_id, user_id) VALUES (?, ?)", (message_id, user_id))
+
+    async def remove_subscription(self, message_id, user_id):
+        await self._run(self._execute, "DELETE FROM subscriptions WHERE message_id = ? AND user_id = ?", (message_id, user_id))
+
+    async def clear_subscriptions(self, message_id):
+        def clear():
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM subscriptions WHERE message_id = ?", (message_id,))
+                conn.execute("DELETE FROM pings_sent WHERE message_id = ?", (message_id,))
+        await self._run(clear)
+
+    async def claim_pings(self, message_id, due, user_ids):
+        """Atomically marks the reminder due at `due` as sent to each still-subscribed user.
+
+        Returns the users this call claimed: whoever claims a user sends their ping, so two
+        processes (or a reschedule) never ping the same user twice for the same deadline.
+        """
+        def claim():
+            conn = self._connection()
+            claimed = set()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")  # ✅ Take the write lock before reading
+                subscribed = {row[0] for row in conn.execute("SELECT user_id FROM subscriptions WHERE message_id = ?", (message_id,))}
+                for user_id in user_ids:
+                    if user_id in subscribed and conn.execute(
+                        "INSERT OR IGNORE INTO pings_sent (message_id, user_id, due) VALUES (?, ?, ?)", (message_id, user_id, due)
+                    ).rowcount:
+                        claimed.add(user_id)
+            return claimed
+        return await self._run(claim)
+
+    # ✅ ID sequences
+
+    async def allocate_ids(self, name, count):
+        """Reserves `count` consecutive IDs from a named sequence shared by every process; returns the first."""
+        def allocate():
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT value FROM id_sequences WHERE name = ?", (name,)).fetchone()
+                first = (row[0] if row else 0) + 1
+                conn.execute("INSERT OR REPLACE INTO id_sequences (name, value) VALUES (?, ?)", (name, first + count - 1))
+            return first
+        return await self._run(allocate)
+
+    # ✅ Reminder preferences
+
+    async def get_ping_preference(self, user_id):
+        """Returns (lead_times, dm) for a user, or None if they use the defaults."""
+        rows = await self._run(self._query, "SELECT lead_times, dm FROM ping_preferences WHERE user_id = ?", (user_id,))
+        return (_parse_lead_times(rows[0]["lead_times"]), bool(rows[0]["dm"])) if rows else None
+
+    async def save_ping_preference(self, user_id, lead_times, dm):
+        await self._run(
+            self._execute, "INSERT OR REPLACE INTO ping_preferences (user_id, lead_times, dm) VALUES (?, ?, ?)",
+            (user_id, ",".join(str(lead) for lead in lead_times), int(dm)),
+        )
+
+    async def delete_ping_preference(self, user_id):
+        await self._run(self._execute, "DELETE FROM ping_preferences WHERE user_id = ?", (user_id,))
+
+    # ✅ Reminder messages sent for an event
+
+    async def add_reminder(self, event_id, channel_id, message_id):
+        await self._run(self._execute, "INSERT OR IGNORE INTO reminders (event_id, channel_id, message_id) VALUES (?, ?, ?)", (event_id, channel_id, message_id))
+
+    async def clear_reminders(self, event_id):
+        await self._run(self._execute, "DELETE FROM reminders WHERE event_id = ?", (event_id,))
+
+    # ✅ Boss zone timers
+
+    async def save_boss_timers(self, message_id, timers):
+        """Replaces the boss timers of a zone message with {boss: (respawn, spawn_time)}."""
+        def save():
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM boss_timers WHERE message_id = ?", (message_id,))
+                conn.executemany(
+                    "INSERT INTO boss_timers (message_id, boss_name, respawn, spawn_time) VALUES (?, ?, ?, ?)",
+                    [(message_id, boss, respawn, spawn_time) for boss, (respawn, spawn_time) in timers.items()],
+                )
+        await self._run(save)
+
+    # ✅ Per-channel boards
+
+    async def save_board(self, channel_id, message_id):
+        await self._run(self._execute, "INSERT OR REPLACE INTO boards (channel_id, message_id) VALUES (?, ?)", (channel_id, message_id))
+
+    async def delete_board(self, channel_id):
+        await self._run(self._execute, "DELETE FROM boards WHERE channel_id = ?", (channel_id,))
+
+    # ✅ Personal intel channels
+
+    async def load_intel_channels(self):
+        """Returns {(guild_id, user_id): channel_id}."""
+        rows = await self._run(self._query, "SELECT guild_id, user_id, channel_id FROM intel_channels")
+        return {(row["guild_id"], row["user_id"]): row["channel_id"] for row in rows}
+
+    async def save_intel_channel(self, guild_id, user_id, channel_id):
+        await self._run(self._execute, "INSERT OR REPLACE INTO intel_channels (guild_id, user_id, channel_id) VALUES (?, ?, ?)", (guild_id, user_id, channel_id))
+
+    async def delete_intel_channel(self, guild_id, user_id):
+        await self._run(self._execute, "DELETE FROM intel_channels WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
+
+
+# ✅ Shared store instance
+event_store = EventStore()
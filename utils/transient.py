@@ -0,0 +1,116 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import discord
+import config
+from utils import rest
+
+
+class _Group:
+    """Messages that are cleaned up together (e.g. an error and the command that caused it)."""
+
+    __slots__ = ("key", "channel", "message_ids", "expires_at")
+
+    def __init__(self, key, channel, message_ids, expires_at):
+        self.key = key
+        self.channel = channel
+        self.message_ids = message_ids
+        self.expires_at = expires_at
+
+
+class TransientRegistry:
+    """Registry of short-lived bot messages (errors, !list pages, confirmations).
+
+    Any message of a group finds its group in O(1), 🗑️ removes the whole group
+    with one bulk delete, and groups nobody cleaned up are bulk-deleted per
+    channel once their TTL runs out.
+    """
+
+    def __init__(self, ttl=config.TRANSIENT_TTL):
+        self.ttl = ttl
+        self._groups = {}  # ✅ group key -> group
+        self._by_message = {}  # ✅ message ID -> group
+        self._expiry = []  # ✅ (expires_at, key) heap, entries of removed groups are skipped
+        self._keys = itertools.count()
+
+    def __len__(self):
+        return len(self._groups)
+
+    def __contains__(self, message_id):
+        return message_id in self._by_message
+
+    def register(self, *messages, ttl=None):
+        """Tracks `messages` (all in one channel) as one group; None entries are ignored."""
+        messages = [message for message in messages if message is not None]
+        if not messages:
+            return
+        group = _Group(next(self._keys), messages[0].channel, [message.id for message in messages],
+                       time.time() + (ttl or self.ttl))
+        self._groups[group.key] = group
+        for message_id in group.message_ids:
+            self._by_message[message_id] = group
+        heapq.heappush(self._expiry, (group.expires_at, group.key))
+
+    async def reply(self, ctx, text, with_command=True):
+        """Replies with a 🗑️-removable message; 🗑️ (or the TTL) also removes the user's command unless `with_command` is off."""
+        response = await rest.send(ctx, text[:2000])
+        self.register(response, ctx.message if with_command else None)
+        rest.fire_and_forget(rest.add_reaction(response, "🗑️"))  # ✅ Not awaited: the reply is readable without it
+        return response
+
+    def _remove(self, group):
+        self._groups.pop(group.key, None)
+        for message_id in group.message_ids:
+            self._by_message.pop(message_id, None)
+
+    async def delete_group_of(self, message_id):
+        """Deletes every message in the group `message_id` belongs to. Returns False if it isn't registered."""
+        group = self._by_message.get(message_id)
+        if group is None:
+            return False
+        self._remove(group)
+        await self._bulk_delete(group.channel, group.message_ids)
+        return True
+
+    async def sweep(self, now=None):
+        """Bulk-deletes every expired group, batched per channel. Returns how many messages were removed."""
+        now = now if now is not None else time.time()
+        expired = {}  # ✅ channel ID -> (channel, [message IDs])
+        while self._expiry and self._expiry[0][0] <= now:
+            _, key = heapq.heappop(self._expiry)
+            group = self._groups.get(key)
+            if group is None:
+                continue  # ✅ Already deleted via 🗑️
+            self._remove(group)
+            expired.setdefault(group.channel.id, (group.channel, []))[1].extend(group.message_ids)
+
+        for channel, message_ids in expired.values():
+            await self._bulk_delete(channel, message_ids)
+        return sum(len(message_ids) for _, message_ids in expired.values())
+
+    async def _bulk_delete(self, channel, message_ids):
+        try:
+            await rest.delete_messages(channel, message_ids)
+        except discord.NotFound:
+            pass  # ✅ Already deleted
+        except discord.Forbidden:
+            logging.warning(f"🚫 Missing permissions to delete messages in {channel.name}")
+        except discord.HTTPException as e:
+            logging.error(f"❌ Failed to delete transient messages: {e}")
+
+    async def run(self, interval=config.TRANSIENT_SWEEP_INTERVAL):
+        """Background task: cleans up expired groups every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.sweep()
+                if removed:
+                    logging.debug(f"🧹 Removed {removed} expired transient messages")
+            except Exception:
+                logging.exception("❌ Transient message sweep failed")
+
+
+# ✅ Shared registry instance
+transient_messages = TransientRegistry()